@@ -0,0 +1,20 @@
+"""JSON reading helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional speedup (the "fast" extra); stdlib json otherwise
+    orjson = None
+
+# Both raise a json.JSONDecodeError subclass on malformed input
+loads: Callable[[bytes | str], object] = orjson.loads if orjson is not None else json.loads
+
+
+def read_json(path: Path) -> object:
+    """Parse a JSON file straight from its bytes (no intermediate str)."""
+    return loads(path.read_bytes())
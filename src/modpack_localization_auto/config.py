@@ -13,18 +13,24 @@ from dotenv import load_dotenv
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 load_dotenv(_PROJECT_ROOT / ".env")
 
+# Environment snapshot (including .env values) taken once at import
+_ENV: dict[str, str] = os.environ.copy()
+
 if sys.version_info >= (3, 11):
     import tomllib
 else:
     import tomli as tomllib  # type: ignore[no-redef]
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Application configuration."""
 
     # Modpack
-    slugs: list[str] = field(default_factory=lambda: ["all-the-mods-10"])
+    slugs: tuple[str, ...] = ("all-the-mods-10",)
+
+    # Extraction
+    parallel_extract: bool = True
 
     # Translation
     target_lang: str = "zh_cn"
@@ -33,8 +39,15 @@ class AppConfig:
     llm_temperature: float = 0.3
     llm_timeout: float = 30000.0
     llm_max_retries: int = 30
+    llm_concurrency: int = 4
+    file_concurrency: int = 4
+    use_batch_api: bool = False
+    batch_api_threshold: int = 500
     custom_terminology: dict[str, str] = field(default_factory=dict)
 
+    # Packaging (DEFLATE level for the output zips: 1 = fastest, 9 = smallest)
+    zip_compress_level: int = 1
+
     # OpenAI-compatible LLM (from .env)
     openai_base_url: str = ""
     openai_api_key: str = ""
@@ -53,10 +66,22 @@ class AppConfig:
     dict_repo: str = "zack-zzq/i18n-Dict-Merged"
 
     # Paths
-    project_root: Path = field(default_factory=lambda: _PROJECT_ROOT)
+    project_root: Path = _PROJECT_ROOT
 
     # ── Per-slug path helpers (set slug before using) ──
     _current_slug: str = ""
+    # Cached per-slug roots, rebuilt only when the slug changes
+    _work_dir: Path = field(init=False, repr=False)
+    _output_dir: Path = field(init=False, repr=False)
+    _version_file: Path = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._update_slug_paths()
+
+    def _update_slug_paths(self) -> None:
+        self._work_dir = self.project_root / "work" / self._current_slug
+        self._output_dir = self.project_root / "output" / self._current_slug
+        self._version_file = self._output_dir / "version.json"
 
     @property
     def slug(self) -> str:
@@ -65,18 +90,19 @@ class AppConfig:
     @slug.setter
     def slug(self, value: str) -> None:
         self._current_slug = value
+        self._update_slug_paths()
 
     @property
     def work_dir(self) -> Path:
-        return self.project_root / "work" / self._current_slug
+        return self._work_dir
 
     @property
     def output_dir(self) -> Path:
-        return self.project_root / "output" / self._current_slug
+        return self._output_dir
 
     @property
     def version_file(self) -> Path:
-        return self.output_dir / "version.json"
+        return self._version_file
 
 
 def load_config(config_path: Path | None = None) -> AppConfig:
@@ -91,7 +117,9 @@ def load_config(config_path: Path | None = None) -> AppConfig:
             toml_data = tomllib.load(f)
 
     modpack = toml_data.get("modpack", {})
+    extraction = toml_data.get("extraction", {})
     translation = toml_data.get("translation", {})
+    packaging = toml_data.get("packaging", {})
 
     # Support both "slug" (single) and "slugs" (list) for backward compat
     slugs = modpack.get("slugs", [])
@@ -100,21 +128,27 @@ def load_config(config_path: Path | None = None) -> AppConfig:
         slugs = [single]
 
     return AppConfig(
-        slugs=slugs,
+        slugs=tuple(slugs),
+        parallel_extract=extraction.get("parallel", True),
         target_lang=translation.get("target_lang", "zh_cn"),
         pack_format=translation.get("pack_format", 34),
         llm_batch_size=translation.get("llm_batch_size", 50),
         llm_temperature=translation.get("llm_temperature", 0.3),
         llm_timeout=translation.get("llm_timeout", 30000.0),
         llm_max_retries=translation.get("llm_max_retries", 30),
+        llm_concurrency=translation.get("llm_concurrency", 4),
+        file_concurrency=translation.get("file_concurrency", 4),
+        use_batch_api=translation.get("use_batch_api", False),
+        batch_api_threshold=translation.get("batch_api_threshold", 500),
         custom_terminology=translation.get("terminology", {}),
-        openai_base_url=os.environ.get("OPENAI_BASE_URL", ""),
-        openai_api_key=os.environ.get("OPENAI_API_KEY", ""),
-        openai_model_id=os.environ.get("OPENAI_MODEL_ID", ""),
-        code_llm_base_url=os.environ.get("CODE_LLM_BASE_URL") or os.environ.get("OPENAI_BASE_URL", ""),
-        code_llm_api_key=os.environ.get("CODE_LLM_API_KEY") or os.environ.get("OPENAI_API_KEY", ""),
-        code_llm_model_id=os.environ.get("CODE_LLM_MODEL_ID") or toml_data.get("code_llm", {}).get("model_id") or os.environ.get("OPENAI_MODEL_ID", ""),
-        curseforge_api_key=os.environ.get("CURSEFORGE_API_KEY", ""),
-        github_token=os.environ.get("GITHUB_TOKEN", ""),
+        zip_compress_level=packaging.get("compress_level", 1),
+        openai_base_url=_ENV.get("OPENAI_BASE_URL", ""),
+        openai_api_key=_ENV.get("OPENAI_API_KEY", ""),
+        openai_model_id=_ENV.get("OPENAI_MODEL_ID", ""),
+        code_llm_base_url=_ENV.get("CODE_LLM_BASE_URL") or _ENV.get("OPENAI_BASE_URL", ""),
+        code_llm_api_key=_ENV.get("CODE_LLM_API_KEY") or _ENV.get("OPENAI_API_KEY", ""),
+        code_llm_model_id=_ENV.get("CODE_LLM_MODEL_ID") or toml_data.get("code_llm", {}).get("model_id") or _ENV.get("OPENAI_MODEL_ID", ""),
+        curseforge_api_key=_ENV.get("CURSEFORGE_API_KEY", ""),
+        github_token=_ENV.get("GITHUB_TOKEN", ""),
         dict_repo=toml_data.get("upload", {}).get("dict_repo", "zack-zzq/i18n-Dict-Merged"),
     )
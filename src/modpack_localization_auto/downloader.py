@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 
 from curseforge_dl.api import CurseForgeAPI
@@ -31,8 +31,9 @@ class ModpackInfo:
 
     def save(self, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
+        # All fields are scalars, so a shallow vars() avoids asdict()'s deep copy
         path.write_text(
-            json.dumps(asdict(self), indent=2, ensure_ascii=False) + "\n",
+            json.dumps(vars(self), indent=2, ensure_ascii=False) + "\n",
             encoding="utf-8",
         )
 
@@ -41,38 +42,53 @@ class ModpackInfo:
         if not path.exists():
             return None
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = json.loads(path.read_bytes())
             return cls(**data)
         except Exception:
             return None
 
 
-async def _download_and_install(config: AppConfig) -> ModpackInfo:
+def open_api(config: AppConfig) -> CurseForgeAPI:
+    """Create a CurseForge API session (use as an async context manager).
+
+    One session can be shared by check_for_update and
+    download_and_install_async so both reuse the same connection.
+    """
+    return CurseForgeAPI(api_key=config.curseforge_api_key)
+
+
+async def download_and_install_async(
+    config: AppConfig,
+    api: CurseForgeAPI | None = None,
+) -> ModpackInfo:
     """Async implementation of download and install."""
+    if api is None:
+        async with open_api(config) as api:
+            return await download_and_install_async(config, api)
+
     work_dir = config.work_dir
     install_dir = work_dir / "instance"
     download_dir = work_dir / "downloads"
     download_dir.mkdir(parents=True, exist_ok=True)
     install_dir.mkdir(parents=True, exist_ok=True)
 
-    async with CurseForgeAPI(api_key=config.curseforge_api_key) as api:
-        installer = ModpackInstaller(api)
+    installer = ModpackInstaller(api)
 
-        # Download latest zip (also looks up by slug internally)
-        logger.info("Downloading modpack: %s", config.slug)
-        zip_path, addon, addon_file = await installer.download_modpack_by_slug(
-            config.slug, output_dir=download_dir
-        )
-        logger.info("Downloaded: %s (id=%d)", addon.name, addon.id)
+    # Download latest zip (also looks up by slug internally)
+    logger.info("Downloading modpack: %s", config.slug)
+    zip_path, addon, addon_file = await installer.download_modpack_by_slug(
+        config.slug, output_dir=download_dir
+    )
+    logger.info("Downloaded: %s (id=%d)", addon.name, addon.id)
 
-        # Parse manifest for version info
-        manifest = ModpackInstaller.parse_modpack_info(zip_path)
-        mc_version = manifest.minecraft.version
+    # Parse manifest for version info
+    manifest = ModpackInstaller.parse_modpack_info(zip_path)
+    mc_version = manifest.minecraft.version
 
-        # Install (extract overrides + download mods)
-        logger.info("Installing modpack to: %s", install_dir)
-        await installer.install(zip_path, install_dir)
-        logger.info("Installation complete!")
+    # Install (extract overrides + download mods)
+    logger.info("Installing modpack to: %s", install_dir)
+    await installer.install(zip_path, install_dir)
+    logger.info("Installation complete!")
 
     info = ModpackInfo(
         name=addon.name,
@@ -89,16 +105,22 @@ async def _download_and_install(config: AppConfig) -> ModpackInfo:
 
 def download_and_install(config: AppConfig) -> ModpackInfo:
     """Download and install modpack. Returns ModpackInfo."""
-    return asyncio.run(_download_and_install(config))
+    return asyncio.run(download_and_install_async(config))
 
 
-async def check_for_update(config: AppConfig) -> int | None:
+async def check_for_update(
+    config: AppConfig,
+    api: CurseForgeAPI | None = None,
+) -> int | None:
     """Check CurseForge for the latest file ID. Returns file_id or None."""
-    async with CurseForgeAPI(api_key=config.curseforge_api_key) as api:
-        addon = await api.get_mod_by_slug(config.slug, class_id=SECTION_MODPACK)
-        if addon is None:
-            return None
-        latest = ModpackInstaller._select_latest_file(addon)
-        if latest is None:
-            return None
-        return latest.id
+    if api is None:
+        async with open_api(config) as api:
+            return await check_for_update(config, api)
+
+    addon = await api.get_mod_by_slug(config.slug, class_id=SECTION_MODPACK)
+    if addon is None:
+        return None
+    latest = ModpackInstaller._select_latest_file(addon)
+    if latest is None:
+        return None
+    return latest.id
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 import re
@@ -21,6 +26,34 @@ class ExtractionResults:
     has_ftbquests: bool = False
 
 
+# `event.create(` called with a template literal id, matched on raw bytes
+_CREATE_TEMPLATE_RE = re.compile(rb"event\.create\(\s*`[^`]+?`\s*\)", re.ASCII)
+
+# Scripts larger than this are bundles/minified code, not hand-written registries
+_MAX_ANALYZED_SCRIPT_SIZE = 2_000_000
+
+
+def _has_template_registry(script_file: Path) -> bool:
+    """Check a script for template literal registries without decoding it.
+
+    Skips oversized (typically minified/bundled) scripts, memory-maps the
+    rest and rejects them on a cheap literal search for ``event.create(``
+    before running the (bytes) regex on the survivors.
+    """
+    if os.path.getsize(script_file) > _MAX_ANALYZED_SCRIPT_SIZE:
+        return False
+    with open(script_file, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return False
+        with mm:
+            if mm.find(b"event.create(") < 0:
+                return False
+            return _CREATE_TEMPLATE_RE.search(mm) is not None
+
+
 def extract_mods(install_dir: Path, output_dir: Path) -> int:
     """Extract translatable strings from mod jars."""
     from mods_string_extractor.extractor import extract_mods as _extract_mods
@@ -81,16 +114,25 @@ def extract_kubejs(install_dir: Path, output_dir: Path, config) -> int:
     # [NEW] Code LLM Semantic Analyzer Integration
     # Since complex dynamic registries like `event.create(\`${id}_mechanism\`)` inside loops
     # evade regex, we run a fallback semantic analysis on all scripts containing backticked `.create`.
-    from modpack_localization_auto.kubejs_analyzer import analyze_kubejs_script_for_dynamic_keys
+    from modpack_localization_auto.kubejs_analyzer import analyze_kubejs_scripts
     
     analyzed_keys_count = 0
-    create_template_re = re.compile(r"event\.create\(\s*`.+?`\s*\)")
     
+    candidates: list[tuple[str, str]] = []
+    root_len = len(str(kubejs_dir)) + 1
     for script_file in kubejs_dir.rglob("*.js"):
-        content = script_file.read_text(encoding="utf-8")
-        if create_template_re.search(content):
+        if _has_template_registry(script_file):
             logger.info("Detected template literal registry in %s, sending to Code LLM...", script_file.name)
-            ai_keys = analyze_kubejs_script_for_dynamic_keys(content, config)
+            candidates.append((
+                str(script_file)[root_len:].replace(os.sep, "/"),
+                script_file.read_text(encoding="utf-8"),
+            ))
+
+    # The Code LLM round-trips dominate, so run them concurrently on one event
+    # loop. Results come back in discovery order, keeping key precedence stable.
+    if candidates:
+        results = asyncio.run(analyze_kubejs_scripts(candidates, config))
+        for ai_keys in results:
             if ai_keys:
                 translations.update(ai_keys)
                 analyzed_keys_count += len(ai_keys)
@@ -103,14 +145,13 @@ def extract_kubejs(install_dir: Path, output_dir: Path, config) -> int:
     assets_dir = kubejs_dir / "assets"
     asset_keys_count = 0
     if assets_dir.is_dir():
-        import json
         for lang_file in assets_dir.rglob("lang/en_us.json"):
             try:
-                data = json.loads(lang_file.read_text(encoding="utf-8"))
-                for k, v in data.items():
-                    if isinstance(v, str):
-                        translations[k] = v
-                        asset_keys_count += 1
+                # json.loads accepts UTF-8 bytes directly, skipping a str decode
+                data = json.loads(lang_file.read_bytes())
+                strings = {k: v for k, v in data.items() if type(v) is str}
+                translations.update(strings)
+                asset_keys_count += len(strings)
             except Exception as e:
                 logger.warning("Failed to read KubeJS asset lang file %s: %s", lang_file, e)
                 
@@ -125,29 +166,34 @@ def extract_kubejs(install_dir: Path, output_dir: Path, config) -> int:
     kubejs_output.mkdir(parents=True, exist_ok=True)
     write_lang_json(translations, kubejs_output, namespace="kubejs_string_extractor")
 
-    # Write en_us.json for the extracted strings
-    kubejs_output = output_dir / "kubejs"
-    kubejs_output.mkdir(parents=True, exist_ok=True)
-    write_lang_json(translations, kubejs_output, namespace="kubejs_string_extractor")
-
     return len(translations)
 
 
+# FTB Quests can be in several locations (relative to the install dir)
+_FTBQUESTS_DIRS = (
+    os.path.join("config", "ftbquests", "quests"),
+    os.path.join("ftbquests", "quests"),
+    os.path.join("config", "ftbquests"),
+)
+
+
+def find_ftbquests_dir(install_dir: Path) -> Path | None:
+    """Return the first existing FTB Quests directory, or None.
+
+    Probes with os.path.isdir on plain strings and only builds a Path for
+    the match.
+    """
+    root = str(install_dir)
+    for rel in _FTBQUESTS_DIRS:
+        candidate = os.path.join(root, rel)
+        if os.path.isdir(candidate):
+            return Path(candidate)
+    return None
+
+
 def extract_ftbquests(install_dir: Path, output_dir: Path, modpack_name: str) -> int:
     """Extract translatable strings from FTB Quests."""
-    # FTB Quests can be in several locations
-    quest_paths = [
-        install_dir / "config" / "ftbquests" / "quests",
-        install_dir / "ftbquests" / "quests",
-        install_dir / "config" / "ftbquests",
-    ]
-
-    quests_dir = None
-    for p in quest_paths:
-        if p.is_dir():
-            quests_dir = p
-            break
-
+    quests_dir = find_ftbquests_dir(install_dir)
     if quests_dir is None:
         logger.info("No FTB Quests directory found, skipping")
         return 0
@@ -194,15 +240,26 @@ def extract_all(install_dir: Path, work_dir: Path, modpack_name: str, config) ->
 
     results = ExtractionResults()
 
-    # 1. Mods
-    results.mods_keys = extract_mods(install_dir, extracted_dir)
+    if config.parallel_extract:
+        # The extractors read disjoint inputs and write disjoint output subdirs
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            mods_future = executor.submit(extract_mods, install_dir, extracted_dir)
+            kubejs_future = executor.submit(extract_kubejs, install_dir, extracted_dir, config)
+            ftbquests_future = executor.submit(extract_ftbquests, install_dir, extracted_dir, modpack_name)
+            results.mods_keys = mods_future.result()
+            results.kubejs_keys = kubejs_future.result()
+            results.ftbquests_keys = ftbquests_future.result()
+    else:
+        # 1. Mods
+        results.mods_keys = extract_mods(install_dir, extracted_dir)
 
-    # 2. KubeJS
-    results.kubejs_keys = extract_kubejs(install_dir, extracted_dir, config)
-    results.has_kubejs = results.kubejs_keys > 0
+        # 2. KubeJS
+        results.kubejs_keys = extract_kubejs(install_dir, extracted_dir, config)
 
-    # 3. FTB Quests
-    results.ftbquests_keys = extract_ftbquests(install_dir, extracted_dir, modpack_name)
+        # 3. FTB Quests
+        results.ftbquests_keys = extract_ftbquests(install_dir, extracted_dir, modpack_name)
+
+    results.has_kubejs = results.kubejs_keys > 0
     results.has_ftbquests = results.ftbquests_keys > 0
 
     logger.info(
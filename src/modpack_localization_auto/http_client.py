@@ -0,0 +1,36 @@
+"""Process-wide pooled HTTP client for GitHub and dictionary downloads."""
+
+from __future__ import annotations
+
+import atexit
+import importlib.util
+import threading
+
+import httpx
+
+# HTTP/2 needs the optional h2 package (the "fast" extra); HTTP/1.1 otherwise
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+_client: httpx.Client | None = None
+_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """Return the shared client, creating it on first use.
+
+    Every slug, the dictionary download and the uploader share one connection
+    pool, so repeated requests to github.com / api.github.com skip the TCP and
+    TLS handshakes. The client is closed at interpreter exit.
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = httpx.Client(
+                    http2=_HTTP2,
+                    follow_redirects=True,
+                    timeout=60.0,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+                )
+                atexit.register(_client.close)
+    return _client
@@ -1,14 +1,20 @@
 """LLM-based Semantic Analyzer for KubeJS scripts."""
 
+import asyncio
+import hashlib
 import json
 import logging
+import os
 import re
-from typing import Dict
-
-from openai import OpenAI
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict
 
 from modpack_localization_auto.config import AppConfig
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
 SYSTEM_PROMPT = """You are a KubeJS semantic analysis expert. You will be provided with KubeJS scripts (JavaScript).
@@ -43,7 +49,120 @@ CRITICAL RULES:
 4. IMPORTANT FILTERING: DO NOT extract garbage or debug values. If the generated name is just a 3-4 letter meaningless capitalized acronym (e.g. "ABE", "ACA", "ACD", "AML") or simple numbers, DO NOT include them in the returned JSON. KubeJS authors often do this for internal map variables. We only want legitimate, human-readable item/block/fluid names like "Copper Mechanism" or "Molten Diamond".
 """
 
-def analyze_kubejs_script_for_dynamic_keys(content: str, config: AppConfig) -> Dict[str, str]:
+# A ```json ... ``` (or bare ```) fenced reply; the closing fence is optional
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*(?:```)?", re.DOTALL)
+
+_FILE_MARKER = "=== FILE: {name} ==="
+
+BATCH_PROMPT_SUFFIX = """
+BATCH MODE:
+The input contains several scripts, each introduced by a line of the form `=== FILE: <name> ===`.
+Analyze every script independently and return ONLY a JSON object whose keys are the exact file names and whose values are the `id` -> `display_name` objects described above.
+Every file name must appear in the result, with an empty object {} if it generates nothing.
+"""
+
+# Fixed system messages, shared by every analysis request
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+_BATCH_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT + BATCH_PROMPT_SUFFIX}
+
+# (translation key, display name) templates for every KubeJS create() call.
+# Fluid buckets get their own "_bucket" item.
+_PERMUTATION_TEMPLATES = (
+    ("item.kubejs.%s", "%s"),
+    ("block.kubejs.%s", "%s"),
+    ("fluid.kubejs.%s", "%s"),
+    ("item.kubejs.%s_bucket", "%s Bucket"),
+)
+
+
+def _create_client(config: AppConfig) -> "AsyncOpenAI":
+    """Build the Code LLM client once so all scripts share one connection pool."""
+    # Only pull in the openai/httpx/pydantic stack once we know we'll use it
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(
+        base_url=config.code_llm_base_url if config.code_llm_base_url else None,
+        api_key=config.code_llm_api_key,
+    )
+
+
+def _cache_path(content: str, config: AppConfig) -> Path:
+    """Content-addressed cache location for a script's analysis result."""
+    digest = hashlib.sha256(
+        f"{config.code_llm_model_id}\0{content}".encode("utf-8")
+    ).hexdigest()
+    return config.work_dir / ".llm_cache" / f"{digest}.json"
+
+
+def _load_cached(cache_file: Path) -> Dict[str, str] | None:
+    if not cache_file.exists():
+        return None
+    try:
+        data = json.loads(cache_file.read_bytes())
+        return data if isinstance(data, dict) else None
+    except Exception:
+        return None
+
+
+def _store_cached(cache_file: Path, inferred_map: Dict[str, str]) -> None:
+    """Write atomically so an interrupted run never leaves a truncated entry."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(inferred_map, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_name, cache_file)
+    except Exception as e:
+        logger.warning("Failed to write Code LLM cache %s: %s", cache_file.name, e)
+
+
+def _expand_permutations(inferred_map: Dict[str, str]) -> Dict[str, str]:
+    """Turn an ``{id: display_name}`` map into KubeJS translation keys."""
+    # Now, expand these IDs into the definitive KubeJS localization permutation formats
+    # Since KubeJS registers an item, block, fluid, and bucket for every single create() call under the hood,
+    # we generate all formats as translations to be safe.
+    final_permutations: dict[str, str] = {
+        key_fmt % item_id: name_fmt % eng_name
+        for item_id, eng_name in inferred_map.items()
+        for key_fmt, name_fmt in _PERMUTATION_TEMPLATES
+    }
+        
+    if final_permutations:
+        logger.info("LLM gracefully extracted %d dynamic keys!", len(final_permutations))
+        
+    return final_permutations
+
+
+async def _request_inferred_map(
+    client: "AsyncOpenAI",
+    config: AppConfig,
+    system_message: dict[str, str],
+    user_content: str,
+) -> dict:
+    """Send one analysis request and parse the (possibly fenced) JSON reply."""
+    response = await client.chat.completions.create(
+        model=config.code_llm_model_id,
+        messages=[system_message, {"role": "user", "content": user_content}],
+        temperature=0.1,  # We want highly deterministic code analysis
+        timeout=120.0,
+    )
+    
+    reply = response.choices[0].message.content or "{}"
+    
+    # Clean up potential markdown formatting natively as a fallback
+    reply = reply.strip()
+    fenced = _FENCE_RE.fullmatch(reply)
+    if fenced:
+        reply = fenced.group(1)
+        
+    return json.loads(reply)
+
+
+async def analyze_kubejs_script_for_dynamic_keys(
+    content: str,
+    config: AppConfig,
+    client: "AsyncOpenAI | None" = None,
+) -> Dict[str, str]:
     """
     Use the designated Code LLM to analyze a JS file for dynamic template literal registries.
     Returns a dictionary of permutations (kubejs.item.xxx, kubejs.block.xxx) mapping to their names.
@@ -52,54 +171,103 @@ def analyze_kubejs_script_for_dynamic_keys(content: str, config: AppConfig) -> D
         logger.warning("Code LLM is not configured. Skipping JS Semantic Analysis.")
         return {}
 
+    cache_file = _cache_path(content, config)
+    inferred_map = _load_cached(cache_file)
+    if inferred_map is not None:
+        logger.info("Using cached Code LLM analysis (%s)", cache_file.stem[:12])
+        return _expand_permutations(inferred_map)
+
+    if client is None:
+        client = _create_client(config)
+
     logger.info("Triggering LLM Semantic Analyzer for KubeJS script...")
     
-    client = OpenAI(
-        base_url=config.code_llm_base_url if config.code_llm_base_url else None,
-        api_key=config.code_llm_api_key,
-    )
-    
     try:
-        response = client.chat.completions.create(
-            model=config.code_llm_model_id,
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": content},
-            ],
-            temperature=0.1,  # We want highly deterministic code analysis
-            timeout=120.0,
-        )
-        
-        reply = response.choices[0].message.content or "{}"
-        
-        # Clean up potential markdown formatting natively as a fallback
-        reply = reply.strip()
-        if reply.startswith("```json"):
-            reply = reply[7:]
-        if reply.startswith("```"):
-            reply = reply[3:]
-        if reply.endswith("```"):
-            reply = reply[:-3]
-            
-        inferred_map: dict[str, str] = json.loads(reply.strip())
-        
-        # Now, expand these IDs into the definitive KubeJS localization permutation formats
-        # Since KubeJS registers an item, block, fluid, and bucket for every single create() call under the hood,
-        # we generate all formats as translations to be safe.
-        final_permutations: dict[str, str] = {}
-        for item_id, eng_name in inferred_map.items():
-            final_permutations[f"item.kubejs.{item_id}"] = eng_name
-            final_permutations[f"block.kubejs.{item_id}"] = eng_name
-            final_permutations[f"fluid.kubejs.{item_id}"] = eng_name
-            
-            # Fluid buckets: _bucket
-            final_permutations[f"item.kubejs.{item_id}_bucket"] = f"{eng_name} Bucket"
-            
-        if final_permutations:
-            logger.info("LLM gracefully extracted %d dynamic keys!", len(final_permutations))
-            
+        inferred_map = await _request_inferred_map(client, config, _SYSTEM_MESSAGE, content)
+        final_permutations = _expand_permutations(inferred_map)
+        _store_cached(cache_file, inferred_map)
         return final_permutations
         
     except Exception as e:
         logger.error("LLM Analyzer failed on script: %s", e)
         return {}
+
+
+async def _analyze_batch(
+    batch: list[tuple[str, str]],
+    config: AppConfig,
+    client: "AsyncOpenAI",
+) -> list[Dict[str, str]]:
+    """Analyze several scripts in one request, falling back to one request per
+    script for any file the batched reply does not cover."""
+    if len(batch) == 1:
+        return [await analyze_kubejs_script_for_dynamic_keys(batch[0][1], config, client)]
+
+    logger.info("Triggering LLM Semantic Analyzer for %d KubeJS scripts in one request...", len(batch))
+    user_content = "\n\n".join(
+        f"{_FILE_MARKER.format(name=name)}\n{content}" for name, content in batch
+    )
+    try:
+        reply = await _request_inferred_map(client, config, _BATCH_SYSTEM_MESSAGE, user_content)
+        if not isinstance(reply, dict):
+            raise ValueError("batched reply is not a JSON object")
+    except Exception as e:
+        logger.warning("Batched LLM analysis failed, retrying scripts one by one: %s", e)
+        reply = {}
+
+    results: list[Dict[str, str]] = []
+    for name, content in batch:
+        inferred_map = reply.get(name)
+        if isinstance(inferred_map, dict):
+            results.append(_expand_permutations(inferred_map))
+            _store_cached(_cache_path(content, config), inferred_map)
+        else:
+            results.append(await analyze_kubejs_script_for_dynamic_keys(content, config, client))
+    return results
+
+
+async def analyze_kubejs_scripts(
+    scripts: list[tuple[str, str]],
+    config: AppConfig,
+    max_concurrency: int = 8,
+    batch_size: int = 4,
+) -> list[Dict[str, str]]:
+    """
+    Analyze several ``(name, content)`` scripts concurrently with a shared client.
+    Uncached scripts are grouped ``batch_size`` per request so the system prompt
+    is only paid once per group. Returns one permutation dictionary per input
+    script, in the same order.
+    """
+    if not scripts:
+        return []
+    if not config.code_llm_api_key or not config.code_llm_model_id:
+        logger.warning("Code LLM is not configured. Skipping JS Semantic Analysis.")
+        return [{} for _ in scripts]
+
+    results: list[Dict[str, str]] = [{} for _ in scripts]
+    pending: list[int] = []
+    for idx, (_, content) in enumerate(scripts):
+        cached = _load_cached(_cache_path(content, config))
+        if cached is not None:
+            results[idx] = _expand_permutations(cached)
+        else:
+            pending.append(idx)
+
+    if not pending:
+        logger.info("Using cached Code LLM analysis for all %d scripts", len(scripts))
+        return results
+
+    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with _create_client(config) as client:
+        async def _bounded(indices: list[int]) -> list[Dict[str, str]]:
+            async with semaphore:
+                return await _analyze_batch([scripts[i] for i in indices], config, client)
+
+        batch_results = await asyncio.gather(*(_bounded(b) for b in batches))
+
+    for indices, batch_result in zip(batches, batch_results):
+        for idx, permutations in zip(indices, batch_result):
+            results[idx] = permutations
+    return results
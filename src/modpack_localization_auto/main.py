@@ -3,17 +3,27 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import dataclasses
+import hashlib
 import json
 import logging
+import os
 import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from .config import AppConfig, load_config
-from .downloader import ModpackInfo, download_and_install, check_for_update
-from .extractor import extract_all
-from .translator import translate_all
-from .packager import package_all
-from .uploader import upload_to_dict_repo
+from .downloader import (
+    CurseForgeAPI,
+    ModpackInfo,
+    check_for_update,
+    download_and_install_async,
+    open_api,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +36,18 @@ def _setup_logging() -> None:
     )
 
 
-def run_pipeline(config: AppConfig) -> None:
-    """Execute the full localization pipeline with resumption support."""
+async def _prepare_modpack(
+    config: AppConfig, api: CurseForgeAPI | None = None
+) -> ModpackInfo | None:
+    """Update check + Step 1 over a single CurseForge API session.
+
+    Returns the installed modpack, or None if the existing localization is
+    already up to date. Opens its own session unless *api* is given.
+    """
+    if api is None:
+        async with open_api(config) as api:
+            return await _prepare_modpack(config, api)
+
     # Check if we already have a FINISHED localization for this version
     existing = ModpackInfo.load(config.version_file)
     if existing:
@@ -39,10 +59,10 @@ def run_pipeline(config: AppConfig) -> None:
         )
         # Check for updates
         logger.info("Checking for updates on CurseForge...")
-        latest_id = asyncio.run(check_for_update(config))
+        latest_id = await check_for_update(config, api)
         if latest_id and latest_id == existing.file_id:
             logger.info("Already up to date. No work needed.")
-            return
+            return None
         elif latest_id:
             logger.info(
                 "Update found! Latest file_id=%d (current=%d)",
@@ -58,7 +78,6 @@ def run_pipeline(config: AppConfig) -> None:
     modpack_info = ModpackInfo.load(install_checkpoint)
 
     if modpack_info and Path(modpack_info.install_dir).exists():
-        install_dir = Path(modpack_info.install_dir)
         logger.info("=" * 60)
         logger.info("STEP 1: Resuming from existing install")
         logger.info(
@@ -74,8 +93,7 @@ def run_pipeline(config: AppConfig) -> None:
         logger.info("STEP 1: Download & Install modpack '%s'", config.slug)
         logger.info("=" * 60)
 
-        modpack_info = download_and_install(config)
-        install_dir = Path(modpack_info.install_dir)
+        modpack_info = await download_and_install_async(config, api)
 
         # Save checkpoint immediately so we can resume if interrupted later
         modpack_info.save(install_checkpoint)
@@ -87,12 +105,145 @@ def run_pipeline(config: AppConfig) -> None:
             modpack_info.file_id,
         )
 
+    return modpack_info
+
+
+def _stage_marker(config: AppConfig, name: str) -> Path:
+    return config.work_dir / ".stages" / f"{name}.done"
+
+
+def _stage_done(
+    config: AppConfig, name: str, file_id: int, inputs: list[Path], **expected
+) -> dict | None:
+    """Return the stage's marker data if it finished after all its inputs.
+
+    A marker is stale if it was written for another modpack file, if any
+    input (upstream marker / install checkpoint) is missing or newer, if any
+    of its recorded ``outputs`` is gone, or if a recorded setting differs
+    from *expected*.
+    """
+    marker = _stage_marker(config, name)
+    try:
+        marker_mtime = marker.stat().st_mtime
+        if any(p.stat().st_mtime > marker_mtime for p in inputs):
+            return None
+        data = json.loads(marker.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if data.get("file_id") != file_id:
+        return None
+    if any(data.get(key) != value for key, value in expected.items()):
+        return None
+    if not all(Path(p).is_file() for p in data.get("outputs", ())):
+        return None
+    logger.info("Stage '%s' already done, skipping (marker: %s)", name, marker)
+    return data
+
+
+def _marker_data(config: AppConfig, name: str) -> dict | None:
+    """The stage's marker contents, fresh or not, or None if it is missing."""
+    try:
+        return json.loads(_stage_marker(config, name).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _dir_inputs(path: Path) -> list[Path]:
+    """A directory plus its direct subdirectories, as stage inputs.
+
+    Deleting e.g. ``translated/kubejs/`` or ``translated/mods/<modid>/``
+    bumps one of these mtimes, which invalidates the stage marker.
+    """
+    try:
+        with os.scandir(path) as it:
+            return [path, *(Path(e.path) for e in it if e.is_dir())]
+    except OSError:
+        return [path]
+
+
+def _mark_stage_done(config: AppConfig, name: str, file_id: int, **extra) -> Path:
+    """Write the stage's marker atomically and return its path."""
+    marker = _stage_marker(config, name)
+    marker.parent.mkdir(parents=True, exist_ok=True)
+    tmp = marker.with_suffix(".tmp")
+    tmp.write_text(
+        json.dumps({"phase": name, "timestamp": time.time(), "file_id": file_id, **extra}),
+        encoding="utf-8",
+    )
+    os.replace(tmp, marker)
+    return marker
+
+
+@contextlib.contextmanager
+def _shared_api(config: AppConfig) -> Iterator[Callable[[AppConfig], ModpackInfo | None]]:
+    """Keep one CurseForge session open on a background event loop.
+
+    Yields a blocking ``prepare(config)`` that runs a slug's update check +
+    Step 1 on that loop, so pipelines on worker threads share the session's
+    connections while each slug is still prepared right before it is processed.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="curseforge-api", daemon=True)
+    thread.start()
+
+    def call(coro):
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    stack = contextlib.AsyncExitStack()
+    try:
+        api = call(stack.enter_async_context(open_api(config)))
+        try:
+            yield lambda slug_config: call(_prepare_modpack(slug_config, api))
+        finally:
+            call(stack.aclose())
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def run_pipeline(config: AppConfig, modpack_info: ModpackInfo | None = None) -> None:
+    """Execute the full localization pipeline with resumption support.
+
+    If *modpack_info* is given, the update check and Step 1 have already
+    been done for this slug (see _run_slug) and are skipped.
+    """
+    if modpack_info is None:
+        # One event loop and one CurseForge session for update check + install
+        modpack_info = asyncio.run(_prepare_modpack(config))
+        if modpack_info is None:
+            return
+    install_dir = Path(modpack_info.install_dir)
+
+    # Deferred so an "already up to date" run never loads the heavy stages
+    from .extractor import ExtractionResults, extract_all
+    from .translator import translate_all, translation_settings_digest
+    from .packager import load_source_lang, load_translated_lang, package_all
+    from .uploader import upload_to_dict_repo
+
+    # Each step leaves a marker in work_dir/.stages/ so an interrupted run
+    # resumes after the last finished step; markers chain on their inputs
+    file_id = modpack_info.file_id
+    install_checkpoint = config.work_dir / "modpack_info.json"
+    extracted_dir = config.work_dir / "extracted"
+    translated_dir = config.work_dir / "translated"
+
     # ── Step 2: Extract ───────────────────────────────────────────
     logger.info("=" * 60)
     logger.info("STEP 2: Extract translatable content")
     logger.info("=" * 60)
 
-    extraction = extract_all(install_dir, config.work_dir, modpack_info.name, config)
+    done = _stage_done(
+        config, "extract", file_id, [install_checkpoint, *_dir_inputs(extracted_dir)]
+    )
+    if done:
+        extraction = ExtractionResults(**done["results"])
+        extract_marker = _stage_marker(config, "extract")
+    else:
+        extraction = extract_all(install_dir, config.work_dir, modpack_info.name, config)
+        extract_marker = _mark_stage_done(
+            config, "extract", file_id, results=dataclasses.asdict(extraction)
+        )
 
     total_keys = extraction.mods_keys + extraction.kubejs_keys + extraction.ftbquests_keys
     if total_keys == 0:
@@ -104,27 +255,68 @@ def run_pipeline(config: AppConfig) -> None:
     logger.info("STEP 3: Translate (%d total keys)", total_keys)
     logger.info("=" * 60)
 
-    extracted_dir = config.work_dir / "extracted"
-    translated_dir = config.work_dir / "translated"
-    translate_all(extracted_dir, translated_dir, config)
+    # Model, target_lang and terminology; changing any of them re-runs translation
+    translate_settings = translation_settings_digest(config)
+    if _stage_done(
+        config, "translate", file_id, [extract_marker, *_dir_inputs(translated_dir)],
+        settings=translate_settings,
+    ):
+        translate_marker = _stage_marker(config, "translate")
+    else:
+        previous = _marker_data(config, "translate")
+        if previous and previous.get("settings") not in (None, translate_settings):
+            # Finished files are skipped by translate_all and would be packaged as-is
+            logger.warning(
+                "Translation settings (model, target_lang or terminology) changed; "
+                "files already in %s are kept. Delete it to translate everything again.",
+                translated_dir,
+            )
+        translate_all(extracted_dir, translated_dir, config)
+        translate_marker = _mark_stage_done(
+            config, "translate", file_id, settings=translate_settings
+        )
 
     # ── Step 4: Package ───────────────────────────────────────────
     logger.info("=" * 60)
     logger.info("STEP 4: Package outputs")
     logger.info("=" * 60)
 
-    package_all(config.work_dir, install_dir, config.output_dir, config)
+    # Settings baked into the zips; changing any of them repackages
+    package_settings = hashlib.blake2b(
+        json.dumps([config.target_lang, config.pack_format, config.zip_compress_level]).encode(),
+        digest_size=8,
+    ).hexdigest()
+
+    # Parsed lazily and shared by packaging and the dict upload
+    translated_lang = None
+    if not _stage_done(
+        config, "package", file_id, [translate_marker], settings=package_settings
+    ):
+        translated_lang = load_translated_lang(translated_dir)
+        outputs = package_all(
+            config.work_dir, install_dir, config.output_dir, config, translated_lang,
+            source_lang=load_source_lang(extracted_dir),
+        )
+        _mark_stage_done(
+            config, "package", file_id,
+            settings=package_settings, outputs=[str(p) for p in outputs],
+        )
 
     # ── Step 5: Upload to Dict ────────────────────────────────────
     logger.info("=" * 60)
     logger.info("STEP 5: Upload translations to %s", config.dict_repo)
     logger.info("=" * 60)
 
-    upload_to_dict_repo(
-        extracted_dir, translated_dir,
-        mc_version=modpack_info.mc_version,
-        config=config,
-    )
+    if not _stage_done(config, "upload", file_id, [translate_marker]):
+        uploaded = upload_to_dict_repo(
+            extracted_dir, translated_dir,
+            mc_version=modpack_info.mc_version,
+            config=config,
+            translated_lang=translated_lang,
+        )
+        # A failed/skipped upload is retried on the next run
+        if uploaded:
+            _mark_stage_done(config, "upload", file_id)
 
     # ── Step 6: Save version info ─────────────────────────────────
     modpack_info.save(config.version_file)
@@ -134,10 +326,38 @@ def run_pipeline(config: AppConfig) -> None:
     logger.info("=" * 60)
     logger.info("DONE! Output files in: %s", config.output_dir)
     logger.info("=" * 60)
-    for f in sorted(config.output_dir.iterdir()):
-        if f.is_file():
-            size_kb = f.stat().st_size / 1024
-            logger.info("  %s (%.1f KB)", f.name, size_kb)
+    # scandir entries carry the file type, so only printed files get stat'ed
+    with os.scandir(config.output_dir) as it:
+        entries = sorted((e for e in it if e.is_file()), key=lambda e: e.name)
+    if entries:
+        logger.info(
+            "Output files:\n%s",
+            "\n".join(f"  {e.name} ({e.stat().st_size / 1024:.1f} KB)" for e in entries),
+        )
+
+
+def _run_slug(
+    config: AppConfig,
+    prepare: Callable[[AppConfig], ModpackInfo | None],
+    index: int,
+    total: int,
+) -> bool:
+    """Run one modpack's pipeline, preparing it with *prepare* (see _shared_api).
+
+    Returns False if it failed.
+    """
+    logger.info("")
+    logger.info("━" * 60)
+    logger.info("Processing modpack %d/%d: %s", index + 1, total, config.slug)
+    logger.info("━" * 60)
+    try:
+        modpack_info = prepare(config)
+        if modpack_info is not None:
+            run_pipeline(config, modpack_info)
+        return True
+    except Exception as e:
+        logger.error("Pipeline failed for '%s': %s", config.slug, e, exc_info=True)
+        return False
 
 
 def main() -> None:
@@ -153,6 +373,10 @@ def main() -> None:
     )
     parser.add_argument("config", nargs="?", default=None, help="Path to config.toml")
     parser.add_argument("--slug", dest="only_slug", default=None, help="Only process this slug")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="Max modpacks processed concurrently (default: 1, sequential)",
+    )
     args = parser.parse_args()
 
     config_path = Path(args.config) if args.config else None
@@ -168,30 +392,40 @@ def main() -> None:
     if args.only_slug:
         if args.only_slug not in slugs:
             logger.warning("Slug '%s' not in config, running anyway", args.only_slug)
-        slugs = [args.only_slug]
+        slugs = (args.only_slug,)
 
     logger.info("Modpack Localization Auto v0.1.0")
     logger.info("Slugs: %s", ", ".join(slugs))
     logger.info("Target lang: %s", config.target_lang)
 
+    jobs = max(args.jobs, 1)
+    if jobs > 1:
+        logger.info("Running up to %d pipelines concurrently", jobs)
+
     failed: list[str] = []
-    for i, slug in enumerate(slugs):
-        config.slug = slug
-        logger.info("")
-        logger.info("━" * 60)
-        logger.info("Processing modpack %d/%d: %s", i + 1, len(slugs), slug)
-        logger.info("━" * 60)
-        try:
-            run_pipeline(config)
-        except KeyboardInterrupt:
-            logger.info("\nInterrupted by user.")
-            sys.exit(130)
-        except Exception as e:
-            logger.error("Pipeline failed for '%s': %s", slug, e, exc_info=True)
-            failed.append(slug)
+    executor = ThreadPoolExecutor(max_workers=jobs)
+    try:
+        # Update checks + installs of all slugs share one CurseForge session
+        with _shared_api(config) as prepare:
+            futures = {}
+            for i, slug in enumerate(slugs):
+                # Each pipeline gets its own config copy so per-slug paths don't race
+                slug_config = dataclasses.replace(config, _current_slug=slug)
+                future = executor.submit(_run_slug, slug_config, prepare, i, len(slugs))
+                futures[future] = slug
+            for future in as_completed(futures):
+                if not future.result():
+                    failed.append(futures[future])
+    except KeyboardInterrupt:
+        logger.info("\nInterrupted by user.")
+        # Drop slugs that haven't started; a normal exit still runs atexit
+        # handlers and finally blocks, so caches and markers are left whole
+        executor.shutdown(wait=False, cancel_futures=True)
+        sys.exit(130)
+    executor.shutdown()
 
     if failed:
-        logger.error("Failed slugs: %s", ", ".join(failed))
+        logger.error("Failed slugs: %s", ", ".join(sorted(failed, key=slugs.index)))
         sys.exit(1)
 
 
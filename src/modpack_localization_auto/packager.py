@@ -4,37 +4,365 @@ from __future__ import annotations
 
 import json
 import logging
-import shutil
+import mmap
+import os
+import time
 import zipfile
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import TypeVar
 
 from .config import AppConfig
+from .extractor import find_ftbquests_dir
+
+try:
+    import orjson
+except ImportError:  # optional speedup (the "fast" extra); stdlib json otherwise
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Reader threads / files in flight when prefetching sources for a zip
+_IO_WORKERS = min(8, os.cpu_count() or 1)
+_PREFETCH = 64
+# Entries smaller than this are stored: deflate's setup/framing costs more than it saves
+_STORE_BELOW = 256
+# Formats that are already compressed; deflating them again only burns CPU
+_PRECOMPRESSED_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp", ".ogg", ".zip", ".jar")
+# Output zips are written through a 1 MiB buffer instead of the default 8 KiB
+_WRITE_BUFFER = 1 << 20
+# Files at least this big are mapped instead of read, so zlib reads straight from the page cache
+_MMAP_FROM = 64 * 1024
+
+_T = TypeVar("_T")
+
+_loads: Callable[[bytes], object] = orjson.loads if orjson is not None else json.loads
+
+
+def _snbt_lang(data: dict[str, str]) -> bytes:
+    """Render a flat lang dict as an FTB Quests lang SNBT file.
+
+    Keys and values are JSON-quoted (same escapes SNBT strings use) and the
+    lines collected as bytes for a single join.
+    """
+    if orjson is not None:
+        quote = orjson.dumps
+    else:
+        def quote(value: object) -> bytes:
+            return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+    parts = [b"{\n"]
+    append = parts.append
+    for k, v in data.items():
+        append(b"\t")
+        append(quote(k))
+        append(b": ")
+        append(quote(v))
+        append(b"\n")
+    append(b"}\n")
+    return b"".join(parts)
+
+
+def _dumps(obj: object) -> bytes:
+    """Serialize as 2-space indented UTF-8 JSON with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+        )
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _write_json(zf: zipfile.ZipFile, arcname: str, data: object) -> None:
+    """Write *data* as an indented JSON zip entry."""
+    # Same metadata writestr() would use for a plain name
+    info = _zip_info(zf, arcname, time.time(), 0o600)
+    zf.writestr(info, _dumps(data), compresslevel=zf.compresslevel)
+
+
+def _zip_info(zf: zipfile.ZipFile, arcname: str, mtime: float, mode: int) -> zipfile.ZipInfo:
+    """Build a ZipInfo using the archive's compression method.
+
+    The level is not stored here; callers pass ``compresslevel=zf.compresslevel``
+    to writestr(), which otherwise falls back to zlib's default for ZipInfo
+    arguments.
+    """
+    date_time = time.localtime(mtime)[:6]
+    if date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)
+    info = zipfile.ZipInfo(arcname, date_time=date_time)
+    info.compress_type = zf.compression
+    info.external_attr = (mode & 0xFFFF) << 16
+    return info
+
+
+def _read_for_zip(
+    zf: zipfile.ZipFile, src: str | Path, arcname: str
+) -> tuple[zipfile.ZipInfo, bytes | mmap.mmap]:
+    """Read a file plus the zip metadata zf.write() would have recorded.
+
+    The metadata comes from an fstat on the already-open file rather than
+    the separate path stat ZipInfo.from_file() would do. Large files come
+    back as a read-only mmap (the caller closes it) to skip the copy into
+    a bytes object.
+    """
+    with open(src, "rb") as f:
+        st = os.fstat(f.fileno())
+        if st.st_size >= _MMAP_FROM:
+            data: bytes | mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = f.read()
+    info = _zip_info(zf, arcname, st.st_mtime, st.st_mode)
+    info.file_size = len(data)
+    if info.file_size < _STORE_BELOW or arcname.endswith(_PRECOMPRESSED_SUFFIXES):
+        info.compress_type = zipfile.ZIP_STORED
+    return info, data
+
+
+def _prefetch(fn: Callable[..., _T], args: Iterable[tuple]) -> Iterator[_T]:
+    """Yield ``fn(*a)`` for each tuple in *args*, in order, computed ahead on a pool.
+
+    At most _PREFETCH calls are in flight, which bounds memory while letting
+    reads/encoding on the pool overlap with DEFLATE on the consuming thread
+    (zlib releases the GIL).
+    """
+    pending: deque[Future[_T]] = deque()
+    with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+        for a in args:
+            pending.append(executor.submit(fn, *a))
+            if len(pending) >= _PREFETCH:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _write_files(zf: zipfile.ZipFile, files: Iterable[tuple[str | Path, str]]) -> int:
+    """Write (source, arcname) pairs into the zip, returning the file count.
 
-def _copy_tree(src: Path, dst: Path) -> int:
-    """Recursively copy directory tree, return file count."""
+    ZipFile only supports one writer, so compression stays on this thread;
+    file reads are prefetched on a small pool.
+    """
     count = 0
-    for item in src.rglob("*"):
-        if item.is_file():
-            rel = item.relative_to(src)
-            target = dst / rel
-            target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(item, target)
-            count += 1
+    for info, data in _prefetch(_read_for_zip, ((zf, src, arcname) for src, arcname in files)):
+        try:
+            zf.writestr(info, data, compresslevel=zf.compresslevel)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+        count += 1
     return count
 
 
-def _create_pack_mcmeta(pack_format: int, description: str) -> str:
-    """Generate pack.mcmeta JSON content."""
-    meta = {
-        "pack": {
-            "pack_format": pack_format,
-            "description": description,
+def _encode_json(zf: zipfile.ZipFile, arcname: str, data: object) -> tuple[zipfile.ZipInfo, bytes]:
+    """Serialize *data* the way _write_json does, for writing later."""
+    return _zip_info(zf, arcname, time.time(), 0o600), _dumps(data)
+
+
+def _encode_mod_lang(
+    zf: zipfile.ZipFile,
+    arcname: str,
+    data: dict[str, str],
+    source: dict[str, str] | None,
+    translated_file: Path,
+) -> tuple[zipfile.ZipInfo, bytes, int] | None:
+    """Encode a mod's translated lang, minus entries identical to the source.
+
+    Untranslated passthrough strings add nothing to the pack: the game falls
+    back to lower-priority packs / en_us for missing keys anyway. Returns
+    None when nothing is left. If nothing was dropped, the translated file
+    (written as indented UTF-8 JSON by the translator) is packed verbatim
+    instead of being serialized again.
+    """
+    if source is not None:
+        kept = {k: v for k, v in data.items() if source.get(k) != v}
+        if not kept:
+            return None
+        if len(kept) < len(data):
+            info, encoded = _encode_json(zf, arcname, kept)
+            return info, encoded, len(kept)
+    try:
+        encoded = translated_file.read_bytes()
+    except OSError:
+        info, encoded = _encode_json(zf, arcname, data)
+    else:
+        info = _zip_info(zf, arcname, time.time(), 0o600)
+    return info, encoded, len(data)
+
+
+def _scandir_files(
+    root: str,
+    suffix: str | None = None,
+    dir_mtimes: dict[str, int] | None = None,
+) -> Iterator[tuple[str, str]]:
+    """Yield ``(path, posix path relative to root)`` for files under *root*.
+
+    An explicit stack of os.scandir calls: DirEntry caches the file type so
+    there is no extra stat per entry, and relative paths are built by string
+    concatenation rather than Path arithmetic. Like os.walk, symlinked
+    directories are not descended into and unreadable directories are skipped.
+    If *dir_mtimes* is given, each visited directory's mtime_ns is recorded
+    in it.
+    """
+    stack = [(root, "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            if dir_mtimes is not None:
+                dir_mtimes[dir_path] = os.stat(dir_path).st_mtime_ns
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, f"{rel_dir}{entry.name}/"))
+                    elif (suffix is None or entry.name.endswith(suffix)) and entry.is_file():
+                        yield entry.path, rel_dir + entry.name
+        except OSError:
+            continue
+
+
+def _read_lang(lang_file: str) -> dict | None:
+    """Parse one lang file; None if missing or invalid."""
+    try:
+        with open(lang_file, "rb") as f:
+            head = f.read(64)
+            # Pruned mods leave a bare "{}"; no need to read or parse it
+            if len(head) < 64 and head.strip() == b"{}":
+                return {}
+            data = _loads(head + f.read())
+    except Exception:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def load_translated_lang(translated_dir: Path) -> dict[str, dict[str, str]]:
+    """Parse every translated/mods/<modid>/en_us.json once.
+
+    The result is shared by the resource pack builder and the dict uploader
+    so neither has to re-read and re-parse the same files. Unreadable or
+    invalid files are left out. Files are read and parsed on the prefetch
+    pool, so the reads overlap instead of running one after another.
+    """
+    return _load_mod_langs(translated_dir / "mods")
+
+
+def load_source_lang(extracted_dir: Path) -> dict[str, dict[str, str]]:
+    """Parse every extracted/mods/<modid>/en_us.json (the English source) once.
+
+    Like load_translated_lang(), shared by the resource pack builder and the
+    dict uploader.
+    """
+    return _load_mod_langs(extracted_dir / "mods")
+
+
+def _load_mod_langs(mods_path: Path) -> dict[str, dict[str, str]]:
+    result: dict[str, dict[str, str]] = {}
+    try:
+        with os.scandir(mods_path) as it:
+            modids = sorted(e.name for e in it if e.is_dir())
+    except OSError:
+        return result
+    mods_dir = os.fspath(mods_path)
+    langs = _prefetch(_read_lang, (
+        (os.path.join(mods_dir, modid, "en_us.json"),) for modid in modids
+    ))
+    for modid, data in zip(modids, langs):
+        if data is not None:
+            result[modid] = data
+    return result
+
+
+def index_misc_packs(
+    misc_packs_dir: Path, cache_file: Path | None = None
+) -> dict[str, list[tuple[str, str]]]:
+    """Walk misc-localization-packs once.
+
+    Returns ``{top-level dir: [(file path, posix zip path), ...]}`` with zip
+    paths relative to misc_packs_dir, so callers can pack files without
+    re-scanning the tree.
+
+    With *cache_file*, the index is reused across runs as long as no
+    directory in the tree changed (adding, removing or renaming an entry
+    bumps its parent directory's mtime), which costs one stat per directory
+    instead of listing them all.
+    """
+    if cache_file is not None:
+        cached = _load_misc_index(misc_packs_dir, cache_file)
+        if cached is not None:
+            return cached
+
+    index: dict[str, list[tuple[str, str]]] = {}
+    dir_mtimes: dict[str, int] = {}
+    root = os.fspath(misc_packs_dir)
+    try:
+        dir_mtimes[root] = os.stat(root).st_mtime_ns
+        with os.scandir(root) as it:
+            top_dirs = [e for e in it if e.is_dir()]
+    except OSError:
+        return index
+    # Loose files at the top level are not packed
+    for top in top_dirs:
+        index[top.name] = [
+            (path, f"{top.name}/{rel}")
+            for path, rel in _scandir_files(top.path, dir_mtimes=dir_mtimes)
+        ]
+
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(".tmp")
+            tmp.write_bytes(_dumps({"root": root, "dirs": dir_mtimes, "index": index}))
+            os.replace(tmp, cache_file)
+        except OSError as e:
+            logger.debug("Could not write misc pack index cache: %s", e)
+    return index
+
+
+def _load_misc_index(
+    misc_packs_dir: Path, cache_file: Path
+) -> dict[str, list[tuple[str, str]]] | None:
+    """Return the cached misc pack index if every directory is unchanged."""
+    try:
+        cached = _loads(cache_file.read_bytes())
+        if cached["root"] != os.fspath(misc_packs_dir):
+            return None
+        for dir_path, mtime_ns in cached["dirs"].items():
+            if os.stat(dir_path).st_mtime_ns != mtime_ns:
+                return None
+        return {
+            top: [(path, arcname) for path, arcname in files]
+            for top, files in cached["index"].items()
         }
-    }
-    return json.dumps(meta, indent=2, ensure_ascii=False) + "\n"
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def is_single_file_ftbquests(install_dir: Path) -> bool:
+    """Whether the install's FTB Quests use the single lang/en_us.snbt layout.
+
+    Newer FTB Quests keep all quest text in one ``lang/en_us.snbt`` file
+    instead of a ``lang/en_us/`` directory (or inline in the chapters).
+    """
+    quests_dir = find_ftbquests_dir(install_dir)
+    if quests_dir is None:
+        return False
+    lang_dir = os.path.join(quests_dir, "lang")
+    return os.path.isfile(os.path.join(lang_dir, "en_us.snbt")) and not os.path.isdir(
+        os.path.join(lang_dir, "en_us")
+    )
+
+
+def _create_pack_mcmeta(pack_format: int, description: str) -> bytes:
+    """Generate pack.mcmeta JSON content.
+
+    Fixed shape, so it is filled into a template instead of going through
+    a JSON encoder; only the description needs escaping.
+    """
+    desc = description.replace("\\", "\\\\").replace('"', '\\"')
+    return (
+        f'{{\n  "pack": {{\n    "pack_format": {int(pack_format)},\n'
+        f'    "description": "{desc}"\n  }}\n}}\n'
+    ).encode("utf-8")
 
 
 def build_resource_pack(
@@ -42,6 +370,10 @@ def build_resource_pack(
     misc_packs_dir: Path,
     output_zip: Path,
     config: AppConfig,
+    translated_lang: dict[str, dict[str, str]] | None = None,
+    misc_files: dict[str, list[tuple[str, str]]] | None = None,
+    ftbq_single_file: bool | None = None,
+    source_lang: dict[str, dict[str, str]] | None = None,
 ) -> int:
     """Build the resource pack zip from translated mods + misc packs.
 
@@ -50,6 +382,14 @@ def build_resource_pack(
         misc_packs_dir: Path to libs/misc-localization-packs.
         output_zip: Output zip file path.
         config: App configuration.
+        translated_lang: Pre-parsed mod lang files from
+            load_translated_lang(); loaded here if not given.
+        misc_files: File index from index_misc_packs(); scanned here if
+            not given.
+        ftbq_single_file: Result of is_single_file_ftbquests() for the
+            install; probed here if not given.
+        source_lang: Pre-parsed English sources from load_source_lang();
+            loaded here if not given.
 
     Returns:
         Number of files packed.
@@ -57,103 +397,113 @@ def build_resource_pack(
     output_zip.parent.mkdir(parents=True, exist_ok=True)
     file_count = 0
 
-    with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+    with (
+        open(output_zip, "wb", buffering=_WRITE_BUFFER) as fp,
+        zipfile.ZipFile(fp, "w", zipfile.ZIP_DEFLATED, compresslevel=config.zip_compress_level) as zf,
+    ):
         # pack.mcmeta
         description = f"{config.slug} 自动本地化资源包"
         zf.writestr(
             "pack.mcmeta",
             _create_pack_mcmeta(config.pack_format, description),
+            compress_type=zipfile.ZIP_STORED,
         )
 
         pack_png = config.project_root / "resources" / "pack.png"
         if pack_png.is_file():
-            zf.write(pack_png, "pack.png")
+            zf.write(pack_png, "pack.png", compress_type=zipfile.ZIP_STORED)
 
         # 1. Mods translations -> assets/<modid>/lang/zh_cn.json
         mods_dir = translated_dir / "mods"
-        if mods_dir.is_dir():
-            for modid_dir in sorted(mods_dir.iterdir()):
-                if not modid_dir.is_dir():
-                    continue
-                modid = modid_dir.name
-                # ftbquests is handled separately (merged with quest lang)
-                if modid == "ftbquests":
-                    continue
-                lang_file = modid_dir / "en_us.json"
-                if not lang_file.exists():
-                    continue
+        if translated_lang is None:
+            translated_lang = load_translated_lang(translated_dir)
+        mod_langs = [
+            (modid, data)
+            for modid, data in sorted(translated_lang.items())
+            # ftbquests is handled separately (merged with quest lang)
+            if modid != "ftbquests" and data
+        ]
+        if source_lang is None:
+            source_lang = load_source_lang(translated_dir.with_name("extracted"))
+        # Source comparison and the (pure-Python) indent=2 encoder run on the
+        # pool ahead of the writer
+        encoded_langs = _prefetch(_encode_mod_lang, (
+            (
+                zf,
+                f"assets/{modid}/lang/{config.target_lang}.json",
+                data,
+                source_lang.get(modid),
+                mods_dir / modid / "en_us.json",
+            )
+            for modid, data in mod_langs
+        ))
+        for (modid, _), encoded_lang in zip(mod_langs, encoded_langs):
+            if encoded_lang is None:
+                logger.debug("  Skipped mods: %s (nothing translated)", modid)
+                continue
+            info, encoded, key_count = encoded_lang
+            zf.writestr(info, encoded, compresslevel=zf.compresslevel)
+            file_count += 1
+            logger.info("  Packed mods: %s (%d keys)", modid, key_count)
 
+        mods_jar_dir = config.work_dir / "instance" / "mods"
+        for modid, _ in mod_langs:
+            modid_dir = mods_dir / modid
+
+            # Handle Patchouli Reconstruction
+            patchouli_file = modid_dir / "patchouli.json"
+            if patchouli_file.exists() and mods_jar_dir.exists():
                 try:
-                    content = lang_file.read_text(encoding="utf-8")
-                    data = json.loads(content)
-                except Exception:
-                    continue
-
-                if not data:
-                    continue
-
-                pack_path = f"assets/{modid}/lang/{config.target_lang}.json"
-                zf.writestr(
-                    pack_path,
-                    json.dumps(data, indent=2, ensure_ascii=False) + "\n",
-                )
-                file_count += 1
-                logger.info("  Packed mods: %s (%d keys)", modid, len(data))
-
-                # Handle Patchouli Reconstruction
-                patchouli_file = modid_dir / "patchouli.json"
-                mods_jar_dir = config.work_dir / "instance" / "mods"
-                if patchouli_file.exists() and mods_jar_dir.exists():
-                    try:
-                        patchouli_data = json.loads(patchouli_file.read_text(encoding="utf-8"))
-                        file_map: dict[str, dict[str, str]] = {}
-                        for full_key, translation in patchouli_data.items():
-                            if "::" in full_key:
-                                file_path, json_path = full_key.split("::", 1)
-                                file_map.setdefault(file_path, {})[json_path] = translation
-                        
-                        if file_map:
-                            from mods_string_extractor.packer import _get_jar_for_modid, _replace_patchouli_strings
-                            jar_path = _get_jar_for_modid(mods_jar_dir, modid)
-                            if jar_path:
-                                with zipfile.ZipFile(jar_path, "r") as jar:
-                                    packed_patchouli = 0
-                                    for en_us_path, file_translations in file_map.items():
+                    patchouli_data = _loads(patchouli_file.read_bytes())
+                    file_map: dict[str, dict[str, str]] = {}
+                    for full_key, translation in patchouli_data.items():
+                        if "::" in full_key:
+                            file_path, json_path = full_key.split("::", 1)
+                            file_map.setdefault(file_path, {})[json_path] = translation
+                    
+                    if file_map:
+                        from mods_string_extractor.extractor import _extract_patchouli_strings
+                        from mods_string_extractor.packer import _get_jar_for_modid, _replace_patchouli_strings
+                        jar_path = _get_jar_for_modid(mods_jar_dir, modid)
+                        if jar_path:
+                            with zipfile.ZipFile(jar_path, "r") as jar:
+                                packed_patchouli = 0
+                                for en_us_path, file_translations in file_map.items():
+                                    try:
+                                        ast = _loads(jar.read(en_us_path))
+                                        
+                                        parts = en_us_path.split("/")
+                                        en_us_idx = parts.index("en_us")
+                                        
+                                        zh_cn_parts = parts.copy()
+                                        zh_cn_parts[en_us_idx] = config.target_lang
+                                        zh_cn_path_in_jar = "/".join(zh_cn_parts)
+                                        
+                                        # getinfo() is a dict lookup on the parsed central directory
                                         try:
-                                            ast = json.loads(jar.read(en_us_path))
-                                            
-                                            from mods_string_extractor.extractor import _extract_patchouli_strings
-                                            parts = en_us_path.split("/")
-                                            en_us_idx = parts.index("en_us")
-                                            
-                                            zh_cn_parts = parts.copy()
-                                            zh_cn_parts[en_us_idx] = config.target_lang
-                                            zh_cn_path_in_jar = "/".join(zh_cn_parts)
-                                            
+                                            zh_info = jar.getinfo(zh_cn_path_in_jar)
+                                        except KeyError:
                                             merged_translations = {}
-                                            if zh_cn_path_in_jar in jar.namelist():
-                                                zh_ast = json.loads(jar.read(zh_cn_path_in_jar))
-                                                merged_translations = _extract_patchouli_strings(zh_ast)
-                                            
-                                            merged_translations.update(file_translations)
-                                            
-                                            localized_ast = _replace_patchouli_strings(ast, merged_translations)
-                                            
-                                            parts[en_us_idx] = config.target_lang
-                                            if parts[0] == "data":
-                                                parts[0] = "assets"
-                                            target_path = "/".join(parts)
-                                            zf.writestr(
-                                                target_path,
-                                                json.dumps(localized_ast, indent=2, ensure_ascii=False) + "\n",
-                                            )
-                                            packed_patchouli += 1
-                                        except Exception as e:
-                                            logger.warning("Failed to localize %s: %s", en_us_path, e)
-                                    file_count += packed_patchouli
-                                    logger.info("  Packed %d patchouli files for %s", packed_patchouli, modid)
-                    except json.JSONDecodeError as e:
-                        logger.warning("Invalid JSON in patchouli %s: %s, skipping", patchouli_file, e)
+                                        else:
+                                            zh_ast = _loads(jar.read(zh_info))
+                                            merged_translations = _extract_patchouli_strings(zh_ast)
+                                        
+                                        merged_translations.update(file_translations)
+                                        
+                                        localized_ast = _replace_patchouli_strings(ast, merged_translations)
+                                        
+                                        parts[en_us_idx] = config.target_lang
+                                        if parts[0] == "data":
+                                            parts[0] = "assets"
+                                        target_path = "/".join(parts)
+                                        _write_json(zf, target_path, localized_ast)
+                                        packed_patchouli += 1
+                                    except Exception as e:
+                                        logger.warning("Failed to localize %s: %s", en_us_path, e)
+                                file_count += packed_patchouli
+                                logger.info("  Packed %d patchouli files for %s", packed_patchouli, modid)
+                except json.JSONDecodeError as e:
+                    logger.warning("Invalid JSON in patchouli %s: %s, skipping", patchouli_file, e)
 
         # 2. KubeJS lang -> assets/kubejs_string_extractor/lang/zh_cn.json
         kubejs_dir = translated_dir / "kubejs"
@@ -161,79 +511,60 @@ def build_resource_pack(
             kubejs_lang = kubejs_dir / "assets" / "kubejs_string_extractor" / "lang" / "en_us.json"
             if kubejs_lang.exists():
                 try:
-                    content = kubejs_lang.read_text(encoding="utf-8")
-                    data = json.loads(content)
+                    content = kubejs_lang.read_bytes()
+                    data = _loads(content)
                     if data:
+                        # Parsed only to validate/count; the file itself is packed as-is
                         pack_path = f"assets/kubejs_string_extractor/lang/{config.target_lang}.json"
                         zf.writestr(
-                            pack_path,
-                            json.dumps(data, indent=2, ensure_ascii=False) + "\n",
+                            _zip_info(zf, pack_path, time.time(), 0o600),
+                            content,
+                            compresslevel=zf.compresslevel,
                         )
                         file_count += 1
                         logger.info("  Packed KubeJS lang: %d keys", len(data))
                 except Exception as e:
                     logger.warning("  Failed to pack KubeJS lang: %s", e)
 
-        # Detect FTB Quests single-file format
-        ftbq_install_dir = None
-        install_dir = config.work_dir / "instance"
-        for p in [
-            install_dir / "config" / "ftbquests" / "quests",
-            install_dir / "ftbquests" / "quests",
-            install_dir / "config" / "ftbquests",
-        ]:
-            if p.is_dir():
-                ftbq_install_dir = p
-                break
-                
-        is_single_file_format = False
-        if ftbq_install_dir:
-            lang_file = ftbq_install_dir / "lang" / "en_us.snbt"
-            lang_dir = ftbq_install_dir / "lang" / "en_us"
-            if lang_file.is_file() and not lang_dir.is_dir():
-                is_single_file_format = True
+        if ftbq_single_file is None:
+            ftbq_single_file = is_single_file_ftbquests(config.work_dir / "instance")
 
         # 3. FTB Quests lang -> assets/ftbquests/lang/zh_cn.json
         # Merges mod UI strings + quest content translations into one file
         ftbq_merged: dict[str, str] = {}
         # a) Mod ftbquests lang (UI strings like "block.ftbquests.*")
-        ftbq_mod_lang = translated_dir / "mods" / "ftbquests" / "en_us.json"
-        if ftbq_mod_lang.exists():
+        ftbq_mod_lang = translated_lang.get("ftbquests")
+        if ftbq_mod_lang:
+            ftbq_merged.update(ftbq_mod_lang)
+        # b) Quest content lang (extracted quest strings)
+        has_quest_lang = False
+        if not ftbq_single_file:
+            # Read directly rather than probing with exists() first (and again for the log)
             try:
-                ftbq_merged.update(json.loads(ftbq_mod_lang.read_text(encoding="utf-8")))
-            except Exception:
+                quest_lang_bytes = (translated_dir / "ftbquests" / "en_us.json").read_bytes()
+            except OSError:
                 pass
-        # b) Quest content lang (extracted quest strings)
-        if not is_single_file_format:
-            ftbq_quest_lang = translated_dir / "ftbquests" / "en_us.json"
-            if ftbq_quest_lang.exists():
+            else:
+                has_quest_lang = True
                 try:
-                    ftbq_merged.update(json.loads(ftbq_quest_lang.read_text(encoding="utf-8")))
+                    ftbq_merged.update(_loads(quest_lang_bytes))
                 except Exception:
                     pass
         if ftbq_merged:
             pack_path = f"assets/ftbquests/lang/{config.target_lang}.json"
-            zf.writestr(
-                pack_path,
-                json.dumps(ftbq_merged, indent=2, ensure_ascii=False) + "\n",
-            )
+            _write_json(zf, pack_path, ftbq_merged)
             file_count += 1
-            has_quest_lang = not is_single_file_format and translated_dir.joinpath("ftbquests", "en_us.json").exists()
             logger.info("  Packed FTB Quests lang: %d keys (mod: %s, quests: %s)",
                         len(ftbq_merged),
-                        "yes" if ftbq_mod_lang.exists() else "no",
+                        "yes" if ftbq_mod_lang else "no",
                         "yes" if has_quest_lang else "skipped (single-file override)")
 
         # 3. misc-localization-packs assets
-        misc_assets = misc_packs_dir / "assets"
-        if misc_assets.is_dir():
-            for item in misc_assets.rglob("*"):
-                if item.is_file():
-                    rel = item.relative_to(misc_packs_dir)
-                    # Use forward slashes for zip paths
-                    zip_path = str(rel).replace("\\", "/")
-                    zf.write(item, zip_path)
-                    file_count += 1
+        if misc_files is None:
+            misc_files = index_misc_packs(misc_packs_dir)
+        misc_assets = misc_files.get("assets")
+        if misc_assets:
+            file_count += _write_files(zf, misc_assets)
             logger.info("  Packed misc-localization-packs assets")
 
     logger.info("Resource pack created: %s (%d files)", output_zip.name, file_count)
@@ -245,6 +576,8 @@ def build_overrides_pack(
     install_dir: Path,
     output_zip: Path,
     config: AppConfig,
+    extracted_dir: Path | None = None,
+    ftbq_single_file: bool | None = None,
 ) -> int:
     """Build the overrides zip for files that must overwrite originals.
 
@@ -255,93 +588,73 @@ def build_overrides_pack(
         install_dir: Modpack install directory.
         output_zip: Output zip file path.
         config: App configuration.
+        extracted_dir: Directory with the extracted (rewritten) sources;
+            defaults to the ``extracted`` sibling of translated_dir.
+        ftbq_single_file: Result of is_single_file_ftbquests() for the
+            install; probed here if not given.
 
     Returns:
         Number of files packed.
     """
-    output_zip.parent.mkdir(parents=True, exist_ok=True)
-    file_count = 0
-
-    with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as zf:
-        # Detect FTB Quests format from install dir
-        ftbq_install_dir = None
-        for p in [
-            install_dir / "config" / "ftbquests" / "quests",
-            install_dir / "ftbquests" / "quests",
-            install_dir / "config" / "ftbquests",
-        ]:
-            if p.is_dir():
-                ftbq_install_dir = p
-                break
-                
-        is_single_file_format = False
-        if ftbq_install_dir:
-            lang_file = ftbq_install_dir / "lang" / "en_us.snbt"
-            lang_dir = ftbq_install_dir / "lang" / "en_us"
-            if lang_file.is_file() and not lang_dir.is_dir():
-                is_single_file_format = True
-
-        # 1. FTB Quests: pack overrides
-        extracted_dir = Path(str(translated_dir).replace("translated", "extracted"))
-        ftbq_extracted = extracted_dir / "ftbquests"
-        ftbq_translated = translated_dir / "ftbquests" / "en_us.json"
-        
-        if is_single_file_format and ftbq_translated.exists():
-            # Single-file format: convert translated JSON directly to lang/zh_cn.snbt
-            try:
-                data = json.loads(ftbq_translated.read_text(encoding="utf-8"))
-                # Write back as SNBT string
-                lines = ["{"]
-                for k, v in data.items():
-                    k_esc = json.dumps(k, ensure_ascii=False)
-                    v_esc = json.dumps(v, ensure_ascii=False)
-                    lines.append(f"\t{k_esc}: {v_esc}")
-                lines.append("}")
-                snbt_content = "\n".join(lines) + "\n"
-                
-                zip_path = f"config/ftbquests/quests/lang/{config.target_lang}.snbt"
-                zf.writestr(zip_path, snbt_content.encode("utf-8"))
-                file_count += 1
-                logger.info("  Packed FTB Quests lang override as single SNBT: %s", zip_path)
-            except Exception as e:
-                logger.warning("  Failed to pack single-file FTB Quests override: %s", e)
-        elif ftbq_extracted.is_dir():
-            # Old format: modified SNBT files replace originals at config/ftbquests/quests/
-            for snbt_file in ftbq_extracted.rglob("*.snbt"):
-                rel = snbt_file.relative_to(ftbq_extracted)
-                zip_path = f"config/ftbquests/quests/{str(rel).replace(chr(92), '/')}"
-                zf.write(snbt_file, zip_path)
-                file_count += 1
-            if file_count > 0 and not is_single_file_format:
-                logger.info("  Packed FTB Quests SNBT overrides (%d files)", file_count)
-
-        # 2. KubeJS rewritten scripts
-        # The extractor rewrites JS files with Text.translatable() calls
-        # They're saved in extracted/kubejs/{client_scripts,server_scripts,...}/
-        kubejs_extracted = extracted_dir / "kubejs"
-        if kubejs_extracted.is_dir():
-            kubejs_count = 0
-            script_dirs = ("client_scripts", "server_scripts", "startup_scripts")
-            for script_dir_name in script_dirs:
-                script_dir = kubejs_extracted / script_dir_name
-                if not script_dir.is_dir():
-                    continue
-                for js_file in script_dir.rglob("*.js"):
-                    rel = js_file.relative_to(kubejs_extracted)
-                    zip_path = f"kubejs/{str(rel).replace(chr(92), '/')}"
-                    zf.write(js_file, zip_path)
-                    file_count += 1
-                    kubejs_count += 1
-            if kubejs_count > 0:
-                logger.info("  Packed KubeJS script overrides (%d files)", kubejs_count)
-
-    if file_count > 0:
-        logger.info("Overrides pack created: %s (%d files)", output_zip.name, file_count)
+    if extracted_dir is None:
+        extracted_dir = translated_dir.with_name("extracted")
+    if ftbq_single_file is None:
+        ftbq_single_file = is_single_file_ftbquests(install_dir)
+
+    # Collect everything first so an empty overrides pack never opens a zip
+
+    # 1. FTB Quests: pack overrides
+    snbt_lang: bytes | None = None
+    snbt_lang_path = f"config/ftbquests/quests/lang/{config.target_lang}.snbt"
+    snbt_files: list[tuple[str, str]] = []
+    ftbq_translated = translated_dir / "ftbquests" / "en_us.json"
+    if ftbq_single_file and ftbq_translated.exists():
+        # Single-file format: convert translated JSON directly to lang/zh_cn.snbt
+        try:
+            snbt_lang = _snbt_lang(_loads(ftbq_translated.read_bytes()))
+        except Exception as e:
+            logger.warning("  Failed to pack single-file FTB Quests override: %s", e)
     else:
-        # Remove empty zip
+        # Old format: modified SNBT files replace originals at config/ftbquests/quests/
+        snbt_files = [
+            (snbt_file, f"config/ftbquests/quests/{rel}")
+            for snbt_file, rel in _scandir_files(str(extracted_dir / "ftbquests"), ".snbt")
+        ]
+
+    # 2. KubeJS rewritten scripts
+    # The extractor rewrites JS files with Text.translatable() calls
+    # They're saved in extracted/kubejs/{client_scripts,server_scripts,...}/
+    kubejs_extracted = extracted_dir / "kubejs"
+    script_files = [
+        (js_file, f"kubejs/{script_dir_name}/{rel}")
+        for script_dir_name in ("client_scripts", "server_scripts", "startup_scripts")
+        for js_file, rel in _scandir_files(str(kubejs_extracted / script_dir_name), ".js")
+    ]
+
+    if snbt_lang is None and not snbt_files and not script_files:
+        # Drop a stale zip from an earlier run
         output_zip.unlink(missing_ok=True)
         logger.info("No override files to pack, skipping overrides zip")
+        return 0
 
+    output_zip.parent.mkdir(parents=True, exist_ok=True)
+    file_count = 0
+    with (
+        open(output_zip, "wb", buffering=_WRITE_BUFFER) as fp,
+        zipfile.ZipFile(fp, "w", zipfile.ZIP_DEFLATED, compresslevel=config.zip_compress_level) as zf,
+    ):
+        if snbt_lang is not None:
+            zf.writestr(snbt_lang_path, snbt_lang)
+            file_count += 1
+            logger.info("  Packed FTB Quests lang override as single SNBT: %s", snbt_lang_path)
+        if snbt_files:
+            file_count += _write_files(zf, snbt_files)
+            logger.info("  Packed FTB Quests SNBT overrides (%d files)", len(snbt_files))
+        if script_files:
+            file_count += _write_files(zf, script_files)
+            logger.info("  Packed KubeJS script overrides (%d files)", len(script_files))
+
+    logger.info("Overrides pack created: %s (%d files)", output_zip.name, file_count)
     return file_count
 
 
@@ -350,19 +663,42 @@ def package_all(
     install_dir: Path,
     output_dir: Path,
     config: AppConfig,
-) -> None:
-    """Run the full packaging pipeline."""
+    translated_lang: dict[str, dict[str, str]] | None = None,
+    source_lang: dict[str, dict[str, str]] | None = None,
+) -> list[Path]:
+    """Run the full packaging pipeline and return the zips it produced."""
     translated_dir = work_dir / "translated"
+    extracted_dir = work_dir / "extracted"
     misc_packs_dir = config.project_root / "libs" / "misc-localization-packs"
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Build resource pack
     rp_zip = output_dir / f"{config.slug}-localization-resourcepack.zip"
-    logger.info("Building resource pack: %s", rp_zip.name)
-    build_resource_pack(translated_dir, misc_packs_dir, rp_zip, config)
-
-    # Build overrides pack
     overrides_zip = output_dir / f"{config.slug}-localization-overrides.zip"
-    logger.info("Building overrides pack: %s", overrides_zip.name)
-    build_overrides_pack(translated_dir, install_dir, overrides_zip, config)
+
+    # The two zips share no inputs or outputs; build them side by side so
+    # one's file reads overlap the other's DEFLATE (both release the GIL)
+    # Both packs need the FTB Quests layout; probe the install once
+    ftbq_single_file = is_single_file_ftbquests(install_dir)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        logger.info("Building resource pack: %s", rp_zip.name)
+        rp_future = executor.submit(
+            build_resource_pack,
+            translated_dir, misc_packs_dir, rp_zip, config, translated_lang,
+            misc_files=index_misc_packs(
+                misc_packs_dir, work_dir / ".cache" / "misc_packs_index.json"
+            ),
+            ftbq_single_file=ftbq_single_file,
+            source_lang=source_lang,
+        )
+        logger.info("Building overrides pack: %s", overrides_zip.name)
+        overrides_future = executor.submit(
+            build_overrides_pack,
+            translated_dir, install_dir, overrides_zip, config, extracted_dir,
+            ftbq_single_file=ftbq_single_file,
+        )
+        rp_future.result()
+        has_overrides = overrides_future.result() > 0
+
+    return [rp_zip, overrides_zip] if has_overrides else [rp_zip]
@@ -2,20 +2,50 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
 import json
 import logging
+import os
 import re
+import sys
 import time
 from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
+from string import Template
+from typing import TYPE_CHECKING
 
 import httpx
-from openai import OpenAI
 
+from ._json_io import loads as _loads
+from ._json_io import orjson, read_json
 from .config import AppConfig
+from .http_client import get_http_client
+from .translator_cache import LLMResponseCache
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
+
+def _dumps(obj: object) -> bytes:
+    """Serialize like ``json.dumps(indent=2, ensure_ascii=False)`` plus a newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write via a sibling temp file and ``os.replace`` so readers never see a
+    half-written file, even if the run is killed mid-write."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
 # ── Dictionary loader ──────────────────────────────────────────────
 
 DICT_MINI_URL = (
@@ -28,11 +58,86 @@ DICT_PATCHOULI_URL = (
 )
 
 
-def load_dictionary(work_dir: Path) -> tuple[dict[str, list[str]], dict[str, str]]:
+# Parsed dictionary files keyed by a digest of their bytes, so every slug's
+# copy of the same upstream release is only parsed once per process
+_DICT_PARSED: dict[bytes, dict] = {}
+
+
+def _compact_word_dict(data: dict) -> dict[str, str]:
+    """Keep only the most frequent translation of each Dict-Mini entry.
+
+    Nothing reads past ``[0]``, and the interned values (many entries share
+    the same Chinese text) make the resident dictionary much smaller.
+    """
+    intern = sys.intern
+    compact: dict[str, str] = {}
+    for en_text, zh_list in data.items():
+        if isinstance(zh_list, list) and zh_list and isinstance(zh_list[0], str):
+            compact[en_text] = intern(zh_list[0])
+        elif isinstance(zh_list, str) and zh_list:
+            compact[en_text] = intern(zh_list)
+    return compact
+
+
+def _load_json_dict(path: Path, word_dict: bool = False) -> dict:
+    """Parse a dictionary file, reusing the result for identical content.
+
+    ``word_dict`` marks Dict-Mini (english -> [chinese, ...]), which is
+    compacted to english -> chinese.
+    """
+    raw = path.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    cached = _DICT_PARSED.get(digest)
+    if cached is None:
+        data = _loads(raw)
+        if not isinstance(data, dict):
+            data = {}
+        if word_dict:
+            data = _compact_word_dict(data)
+        cached = _DICT_PARSED[digest] = data
+    return cached
+
+
+def _conditional_get(client: httpx.Client, url: str, cache_path: Path) -> httpx.Response:
+    """GET ``url``, sending the ETag saved next to ``cache_path`` if there is one.
+
+    A 304 reply means the cached copy is still current.
+    """
+    headers: dict[str, str] = {}
+    if cache_path.exists():
+        try:
+            etag = cache_path.with_suffix(".etag").read_text(encoding="utf-8").strip()
+        except OSError:
+            etag = ""
+        if etag:
+            headers["If-None-Match"] = etag
+    return client.get(url, headers=headers)
+
+
+def _store_download(resp: httpx.Response, cache_path: Path) -> None:
+    """Save a 200 body and its ETag, or just restart the TTL on a 304."""
+    etag_path = cache_path.with_suffix(".etag")
+    if resp.status_code == 304:
+        os.utime(cache_path)
+        logger.info("  %s unchanged upstream", cache_path.name)
+        return
+    cache_path.write_bytes(resp.content)
+    etag = resp.headers.get("ETag")
+    if etag:
+        etag_path.write_text(etag, encoding="utf-8")
+    else:
+        etag_path.unlink(missing_ok=True)
+
+
+def load_dictionary(work_dir: Path) -> tuple[dict[str, str], dict[str, str]]:
     """Download and load Dict-Mini.json and patchouli_books.json.
 
-    Returns a tuple of (general_dict, patchouli_dict).
-    Checks the file age and redownloads if older than 12 hours.
+    Returns a tuple of (general_dict, patchouli_dict); general_dict maps
+    each English string to its most frequent Chinese translation.
+    Checks the file age and revalidates if older than 12 hours; the upstream
+    ETag is sent along so an unchanged dictionary is not downloaded again.
+    Parsed files are memoized by content (see _load_json_dict), so the
+    returned dicts are shared and must not be mutated.
     """
     cache_path_mini = work_dir / "dict-mini.json"
     cache_path_patchouli = work_dir / "patchouli_books.json"
@@ -53,18 +158,20 @@ def load_dictionary(work_dir: Path) -> tuple[dict[str, list[str]], dict[str, str
         logger.info("Downloading dictionaries...")
         cache_path_mini.parent.mkdir(parents=True, exist_ok=True)
         try:
-            with httpx.Client(follow_redirects=True, timeout=60.0) as client:
-                resp_mini = client.get(DICT_MINI_URL)
+            client = get_http_client()
+            resp_mini = _conditional_get(client, DICT_MINI_URL, cache_path_mini)
+            if resp_mini.status_code != 304:  # httpx treats 304 as an error status
                 resp_mini.raise_for_status()
-                cache_path_mini.write_bytes(resp_mini.content)
+            _store_download(resp_mini, cache_path_mini)
+            
+            resp_patch = _conditional_get(client, DICT_PATCHOULI_URL, cache_path_patchouli)
+            if resp_patch.status_code in (200, 304):
+                _store_download(resp_patch, cache_path_patchouli)
+            else:
+                logger.warning("No patchouli_books.json found upstream, using empty.")
+                cache_path_patchouli.write_text("{}")
+                cache_path_patchouli.with_suffix(".etag").unlink(missing_ok=True)
                 
-                resp_patch = client.get(DICT_PATCHOULI_URL)
-                if resp_patch.status_code == 200:
-                    cache_path_patchouli.write_bytes(resp_patch.content)
-                else:
-                    logger.warning("No patchouli_books.json found upstream, using empty.")
-                    cache_path_patchouli.write_text("{}")
-                    
             logger.info("Dictionaries downloaded.")
         except Exception as e:
             logger.warning("Failed to download dictionaries: %s", e)
@@ -75,17 +182,13 @@ def load_dictionary(work_dir: Path) -> tuple[dict[str, list[str]], dict[str, str
     dict_patchouli = {}
     
     try:
-        data = json.loads(cache_path_mini.read_text(encoding="utf-8"))
-        if isinstance(data, dict):
-            dict_mini = data
+        dict_mini = _load_json_dict(cache_path_mini, word_dict=True)
     except Exception as e:
         logger.warning("Failed to parse Dict-Mini.json: %s", e)
         
     try:
         if cache_path_patchouli.exists():
-            data = json.loads(cache_path_patchouli.read_text(encoding="utf-8"))
-            if isinstance(data, dict):
-                dict_patchouli = data
+            dict_patchouli = _load_json_dict(cache_path_patchouli)
     except Exception as e:
         logger.warning("Failed to parse patchouli_books.json: %s", e)
         
@@ -95,27 +198,52 @@ def load_dictionary(work_dir: Path) -> tuple[dict[str, list[str]], dict[str, str
 # ── Dictionary-based translation ──────────────────────────────────
 
 
+# Values the system prompt tells the model to leave alone: commands and
+# resource locations such as ``minecraft:stone``
+_COMMAND_RE = re.compile(r"/[a-z]")
+_RESOURCE_ID_RE = re.compile(r"[a-z0-9_.-]+:[a-z0-9_./-]+")
+_HAS_LETTER_RE = re.compile(r"[A-Za-z]")
+
+
+def _needs_translation(value: str) -> bool:
+    """Return False for values with nothing to translate.
+
+    That covers numbers/punctuation (no ASCII letters, which also catches text
+    that is already Chinese), commands and bare resource locations.
+    """
+    return (
+        _HAS_LETTER_RE.search(value) is not None
+        and _COMMAND_RE.match(value) is None
+        and _RESOURCE_ID_RE.fullmatch(value) is None
+    )
+
+
 def translate_with_dictionary(
     entries: dict[str, str],
-    dictionary: dict[str, list[str]],
+    dictionary: dict[str, str],
 ) -> tuple[dict[str, str], dict[str, str]]:
     """Translate entries using exact dictionary matching.
 
     Args:
         entries: Mapping of translation_key -> english_value.
-        dictionary: Dict-Mini.json data (english -> [chinese_translations]).
+        dictionary: Compacted Dict-Mini.json data (english -> chinese).
 
     Returns:
         (translated, remaining) — translated entries and untranslated entries.
+        Values that need no translation (see ``_needs_translation``) are
+        returned as translated, unchanged.
     """
     translated: dict[str, str] = {}
     remaining: dict[str, str] = {}
 
     for key, value in entries.items():
-        if value in dictionary and dictionary[value]:
-            translated[key] = dictionary[value][0]  # highest frequency
-        else:
+        zh = dictionary.get(value)
+        if zh:
+            translated[key] = zh
+        elif _needs_translation(value):
             remaining[key] = value
+        else:
+            translated[key] = value  # kept verbatim, never sent to the LLM
 
     logger.info(
         "Dictionary translation: %d translated, %d remaining",
@@ -164,6 +292,10 @@ $dict_context
 """
 
 
+# Alphabetic words of two or more letters (single characters are skipped)
+_WORD_RE = re.compile(r"[a-zA-Z]{2,}")
+
+
 def _build_terminology_context(terminology: dict[str, str]) -> str:
     """Build terminology context for the LLM prompt.
     
@@ -179,9 +311,34 @@ def _build_terminology_context(terminology: dict[str, str]) -> str:
     return "\n".join(lines)
 
 
+# Inverted word indexes keyed by id() of the dictionary they were built from.
+# The dictionary itself is kept alongside so the id cannot be reused.
+_DICT_INDEX: dict[int, tuple[dict, list[str], dict[str, list[int]]]] = {}
+
+
+def _dict_index(dictionary: dict[str, str]) -> tuple[list[str], dict[str, list[int]]]:
+    """Return (keys, word -> key positions) for a dictionary, building it once.
+
+    Each English key is tokenized into lowercase alphabetic words of two or
+    more letters; positions follow the dictionary's own order.
+    """
+    cached = _DICT_INDEX.get(id(dictionary))
+    if cached is not None and cached[0] is dictionary:
+        return cached[1], cached[2]
+
+    keys = list(dictionary)
+    index: dict[str, list[int]] = {}
+    for pos, en_text in enumerate(keys):
+        for word in {w.lower() for w in _WORD_RE.findall(en_text)}:
+            index.setdefault(word, []).append(pos)
+
+    _DICT_INDEX[id(dictionary)] = (dictionary, keys, index)
+    return keys, index
+
+
 def _build_dict_context(
     entries: dict[str, str],
-    dictionary: dict[str, list[str]],
+    dictionary: dict[str, str],
     max_entries: int = 200,
 ) -> str:
     """Build dictionary context for the LLM prompt.
@@ -192,25 +349,22 @@ def _build_dict_context(
     if not dictionary:
         return "（无可用词典条目）"
 
-    # Collect unique words from all values
-    words: set[str] = set()
-    for value in entries.values():
-        # Split on non-alpha characters to get individual words
-        for word in re.split(r"[^a-zA-Z]+", value):
-            if len(word) >= 2:  # skip single characters
-                words.add(word)
-                words.add(word.lower())
-                words.add(word.capitalize())
-
-    # Find matching dictionary entries
+    # Collect unique lowercase words from all values (the index is lowercase)
+    words = frozenset(
+        w.lower() for value in entries.values() for w in _WORD_RE.findall(value)
+    )
+
+    # Find dictionary entries sharing a word, in dictionary order
+    keys, index = _dict_index(dictionary)
+    positions: set[int] = set()
+    for word in words:
+        positions.update(index.get(word, ()))
+
     context_entries: list[str] = []
-    for en_text, zh_list in dictionary.items():
-        if len(context_entries) >= max_entries:
-            break
-        # Check if any word appears in this dictionary entry
-        if any(w in en_text for w in words):
-            zh = zh_list[0] if zh_list else "?"
-            context_entries.append(f"- {en_text} → {zh}")
+    for pos in sorted(positions)[:max_entries]:
+        en_text = keys[pos]
+        zh = dictionary[en_text]
+        context_entries.append(f"- {en_text} → {zh}")
 
     if not context_entries:
         return "（无匹配的词典条目）"
@@ -218,10 +372,255 @@ def _build_dict_context(
     return "\n".join(context_entries)
 
 
+# SYSTEM_PROMPT_TEMPLATE with a terminology table rendered in, keyed by id()
+_PROMPT_TEMPLATES: dict[int, tuple[dict[str, str], Template]] = {}
+
+
+def _prompt_template(terminology: dict[str, str]) -> Template:
+    """Return the system prompt template with ``terminology`` filled in.
+
+    The terminology is the same for every batch of a run, so it is rendered
+    once; only the per-batch dictionary context is substituted afterwards.
+    """
+    cached = _PROMPT_TEMPLATES.get(id(terminology))
+    if cached is not None and cached[0] is terminology:
+        return cached[1]
+    # Escape "$" so the terminology survives the second substitution verbatim
+    term_context = _build_terminology_context(terminology).replace("$", "$$")
+    template = Template(
+        Template(SYSTEM_PROMPT_TEMPLATE).safe_substitute(terminology_context=term_context)
+    )
+    _PROMPT_TEMPLATES[id(terminology)] = (terminology, template)
+    return template
+
+
+def _build_messages(
+    batch: dict[str, str],
+    config: AppConfig,
+    dictionary: dict[str, str],
+) -> tuple[str, str]:
+    """Build the (system, user) message contents for one batch."""
+    # Build context from dictionary
+    dict_context = _build_dict_context(batch, dictionary, max_entries=100)
+    system_prompt = _prompt_template(config.custom_terminology).safe_substitute(
+        dict_context=dict_context,
+    )
+    return system_prompt, json.dumps(batch, indent=2, ensure_ascii=False)
+
+
+# A reply wrapped in a markdown code block (```json ... ```)
+_FENCE_RE = re.compile(r"^\s*```[\w-]*[ \t]*\n?(.*?)\n?\s*(?:```\s*)?$", re.S)
+
+
+def _parse_llm_json(content: str) -> object:
+    """Parse the model's reply, tolerating a surrounding markdown code block."""
+    # Most replies are bare JSON; only look for a fence when that fails
+    try:
+        return _loads(content)
+    except json.JSONDecodeError:
+        match = _FENCE_RE.match(content)
+        if match is None:
+            raise
+        return _loads(match.group(1))
+
+
+def _create_llm_client(config: AppConfig) -> "AsyncOpenAI":
+    """Build one async client so concurrent batches and files share a connection pool."""
+    from openai import AsyncOpenAI
+
+    # Create a strict timeout to prevent indefinite hangs
+    timeout = httpx.Timeout(
+        connect=15000.0,
+        read=config.llm_timeout,
+        write=15000.0,
+        pool=15000.0,
+    )
+    # One keep-alive connection per concurrent batch, reused across files
+    concurrency = max(1, config.llm_concurrency)
+    limits = httpx.Limits(
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency,
+        keepalive_expiry=60.0,
+    )
+    return AsyncOpenAI(
+        base_url=config.openai_base_url or None,
+        api_key=config.openai_api_key,
+        http_client=httpx.AsyncClient(timeout=timeout, limits=limits),
+        max_retries=0,  # We handle retries ourselves
+    )
+
+
+def _open_response_cache(config: AppConfig) -> LLMResponseCache:
+    """Open the per-modpack LLM response cache in the work dir."""
+    return LLMResponseCache(config.work_dir / "llm_cache.sqlite")
+
+
+async def _translate_batch_async(
+    client: "AsyncOpenAI",
+    batch: dict[str, str],
+    batch_idx: int,
+    total_batches: int,
+    config: AppConfig,
+    dictionary: dict[str, str],
+    cache: LLMResponseCache | None = None,
+) -> dict[str, str]:
+    """Translate one batch, retrying with exponential backoff.
+
+    A response already in ``cache`` for the identical prompt is reused
+    without calling the API. Returns an empty dict once all retries are
+    exhausted.
+    """
+    system_prompt, user_content = _build_messages(batch, config, dictionary)
+
+    cache_key = ""
+    if cache is not None:
+        cache_key = LLMResponseCache.key(config.openai_model_id, system_prompt, user_content)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            try:
+                result = _parse_llm_json(cached)
+            except json.JSONDecodeError:
+                result = None
+            if isinstance(result, dict):
+                logger.info("  Batch %d: reused cached response", batch_idx + 1)
+                return result
+
+    logger.info(
+        "LLM translating batch %d/%d (%d entries)...",
+        batch_idx + 1,
+        total_batches,
+        len(batch),
+    )
+    max_retries = config.llm_max_retries
+
+    for attempt in range(max_retries):
+        try:
+            # Use a hard timeout slightly larger than httpx timeout
+            response = await asyncio.wait_for(
+                client.chat.completions.create(
+                    model=config.openai_model_id,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_content},
+                    ],
+                    temperature=config.llm_temperature,
+                ),
+                timeout=config.llm_timeout + 30,
+            )
+
+            content = response.choices[0].message.content or ""
+            result = _parse_llm_json(content)
+            if isinstance(result, dict):
+                if cache is not None:
+                    cache.put(cache_key, content)
+                logger.info(
+                    "  Batch %d: translated %d entries",
+                    batch_idx + 1,
+                    len(result),
+                )
+                return result
+            logger.warning("  Batch %d: unexpected response type", batch_idx + 1)
+
+        except json.JSONDecodeError as e:
+            backoff = min(2 ** attempt, 10)
+            logger.warning(
+                "  Batch %d attempt %d/%d: JSON parse error, retrying in %ds: %s",
+                batch_idx + 1,
+                attempt + 1,
+                max_retries,
+                backoff,
+                e,
+            )
+            if attempt < max_retries - 1:
+                await asyncio.sleep(backoff)
+        except Exception as e:
+            backoff = min(2 ** (attempt + 1), 30)
+            logger.warning(
+                "  Batch %d attempt %d/%d: error, retrying in %ds: %s",
+                batch_idx + 1,
+                attempt + 1,
+                max_retries,
+                backoff,
+                e,
+            )
+            if attempt < max_retries - 1:
+                await asyncio.sleep(backoff)
+
+    logger.error(
+        "  Batch %d: all %d retries exhausted, skipping",
+        batch_idx + 1,
+        max_retries,
+    )
+    return {}
+
+
+async def translate_with_llm_async(
+    entries: dict[str, str],
+    config: AppConfig,
+    dictionary: dict[str, str] | None = None,
+    on_batch_done: "Callable[[dict[str, str]], None] | None" = None,
+    client: "AsyncOpenAI | None" = None,
+    semaphore: asyncio.Semaphore | None = None,
+    cache: LLMResponseCache | None = None,
+) -> dict[str, str]:
+    """Translate entries with up to ``config.llm_concurrency`` batches in flight.
+
+    See :func:`translate_with_llm` for the arguments. ``on_batch_done`` is
+    called from the event loop as each batch finishes, in completion order.
+    Pass ``client`` and ``cache`` to reuse an open client and response cache;
+    otherwise both are opened for this call. Pass ``semaphore`` to share the
+    in-flight batch limit with other concurrent calls.
+    """
+    if not entries:
+        return {}
+
+    if not config.openai_api_key:
+        logger.warning("No OpenAI API key configured, skipping LLM translation")
+        return {}
+
+    if client is None:
+        async with _create_llm_client(config) as own_client:
+            with _open_response_cache(config) as own_cache:
+                return await translate_with_llm_async(
+                    entries, config, dictionary, on_batch_done,
+                    own_client, semaphore, own_cache,
+                )
+
+    translated: dict[str, str] = {}
+    batch_size = config.llm_batch_size
+    items = list(entries.items())
+    batches = [dict(items[i:i + batch_size]) for i in range(0, len(items), batch_size)]
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, config.llm_concurrency))
+
+    async def _bounded(batch_idx: int, batch: dict[str, str]) -> None:
+        async with semaphore:
+            result = await _translate_batch_async(
+                client, batch, batch_idx, len(batches), config, dictionary or {}, cache
+            )
+        if result:
+            translated.update(result)
+            # Real-time progress callback
+            if on_batch_done is not None:
+                on_batch_done(translated)
+
+    outcomes = await asyncio.gather(
+        *(_bounded(i, b) for i, b in enumerate(batches)),
+        return_exceptions=True,
+    )
+
+    for batch_idx, outcome in enumerate(outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error("  Batch %d failed: %s", batch_idx + 1, outcome)
+
+    logger.info("LLM translation complete: %d/%d entries translated", len(translated), len(entries))
+    return translated
+
+
 def translate_with_llm(
     entries: dict[str, str],
     config: AppConfig,
-    dictionary: dict[str, list[str]] | None = None,
+    dictionary: dict[str, str] | None = None,
     on_batch_done: "Callable[[dict[str, str]], None] | None" = None,
 ) -> dict[str, str]:
     """Translate entries using OpenAI-compatible LLM API.
@@ -237,161 +636,136 @@ def translate_with_llm(
     Returns:
         Mapping of translation_key -> translated_value.
     """
-    if not entries:
-        return {}
+    return asyncio.run(
+        translate_with_llm_async(entries, config, dictionary, on_batch_done)
+    )
+
+
+# Statuses after which a Batch API job will not change any more
+_BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
 
+
+def translate_with_batch_api(
+    jobs: list[dict[str, str]],
+    config: AppConfig,
+    dictionary: dict[str, str] | None = None,
+    poll_interval: float = 30.0,
+) -> list[dict[str, str]] | None:
+    """Translate many files' entries in one OpenAI Batch API job.
+
+    Every file in ``jobs`` is split into ``llm_batch_size`` chunks, each
+    becoming one request line tagged ``"{file_id}:{batch_idx}"``. The job
+    is polled until it finishes.
+
+    Returns one translated dict per input file (same order), or None if the
+    job could not be submitted or did not complete, so the caller can fall
+    back to the chat-completions path.
+    """
     if not config.openai_api_key:
         logger.warning("No OpenAI API key configured, skipping LLM translation")
-        return {}
+        return None
 
-    from openai import APITimeoutError, APIConnectionError
-    import httpx
+    from openai import OpenAI
 
-    # Create a strict timeout to prevent indefinite hangs
-    timeout = httpx.Timeout(
-        connect=15000.0,
-        read=config.llm_timeout,
-        write=15000.0,
-        pool=15000.0,
-    )
-    http_client = httpx.Client(timeout=timeout)
+    batch_size = config.llm_batch_size
+    lines: list[str] = []
+    for file_id, entries in enumerate(jobs):
+        items = list(entries.items())
+        for batch_idx, start in enumerate(range(0, len(items), batch_size)):
+            system_prompt, user_content = _build_messages(
+                dict(items[start:start + batch_size]), config, dictionary or {}
+            )
+            lines.append(json.dumps({
+                "custom_id": f"{file_id}:{batch_idx}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": config.openai_model_id,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_content},
+                    ],
+                    "temperature": config.llm_temperature,
+                },
+            }, ensure_ascii=False))
+
+    if not lines:
+        return [{} for _ in jobs]
 
     client = OpenAI(
         base_url=config.openai_base_url or None,
         api_key=config.openai_api_key,
-        http_client=http_client,
-        max_retries=0,  # We handle retries ourselves
     )
-
-    translated: dict[str, str] = {}
-    batch_size = config.llm_batch_size
-    items = list(entries.items())
-    total_batches = (len(items) + batch_size - 1) // batch_size
-    max_retries = config.llm_max_retries
-
-    for batch_idx in range(total_batches):
-        start = batch_idx * batch_size
-        end = min(start + batch_size, len(items))
-        batch = dict(items[start:end])
-
-        logger.info(
-            "LLM translating batch %d/%d (%d entries)...",
-            batch_idx + 1,
-            total_batches,
-            len(batch),
-        )
-
-        # Build context from dictionary
-        dict_context = _build_dict_context(
-            batch, dictionary or {}, max_entries=100
+    try:
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        input_file = client.files.create(
+            file=("translation_batch.jsonl", payload), purpose="batch"
         )
-        term_context = _build_terminology_context(config.custom_terminology)
-        from string import Template
-        system_prompt = Template(SYSTEM_PROMPT_TEMPLATE).safe_substitute(
-            dict_context=dict_context,
-            terminology_context=term_context,
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
         )
+        logger.info("Submitted Batch API job %s (%d requests)", batch.id, len(lines))
 
-        user_content = json.dumps(batch, indent=2, ensure_ascii=False)
+        while batch.status not in _BATCH_FINAL_STATUSES:
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            if counts is not None:
+                logger.info(
+                    "  Batch job %s: %s (%d/%d done, %d failed)",
+                    batch.id, batch.status, counts.completed, counts.total, counts.failed,
+                )
 
-        # Retry logic with exponential backoff
-        import concurrent.futures
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.error("Batch API job %s ended with status %s", batch.id, batch.status)
+            return None
 
-        for attempt in range(max_retries):
-            try:
-                def _do_request():
-                    return client.chat.completions.create(
-                        model=config.openai_model_id,
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_content},
-                        ],
-                        temperature=config.llm_temperature,
-                    )
-                
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(_do_request)
-                    # Use a hard timeout slightly larger than httpx timeout
-                    response = future.result(timeout=config.llm_timeout + 30)
-
-                content = response.choices[0].message.content or ""
-                # Try to extract JSON from response (handle markdown code blocks)
-                content = content.strip()
-                if content.startswith("```"):
-                    # Remove markdown code block
-                    lines = content.split("\n")
-                    lines = lines[1:]  # remove opening ```json
-                    if lines and lines[-1].strip() == "```":
-                        lines = lines[:-1]
-                    content = "\n".join(lines)
-
-                result = json.loads(content)
-                if isinstance(result, dict):
-                    translated.update(result)
-                    logger.info(
-                        "  Batch %d: translated %d entries",
-                        batch_idx + 1,
-                        len(result),
-                    )
-                    # Real-time progress callback
-                    if on_batch_done is not None:
-                        on_batch_done(translated)
-                    break
-                else:
-                    logger.warning("  Batch %d: unexpected response type", batch_idx + 1)
+        output = client.files.content(batch.output_file_id).text
+    except Exception as e:
+        logger.error("Batch API translation failed: %s", e)
+        return None
+    finally:
+        client.close()
+
+    results: list[dict[str, str]] = [{} for _ in jobs]
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = _loads(line)
+            file_id = int(record["custom_id"].split(":", 1)[0])
+            body = record["response"]["body"]
+            result = _parse_llm_json(body["choices"][0]["message"]["content"] or "")
+        except Exception as e:
+            logger.warning("  Skipping unparseable Batch API result: %s", e)
+            continue
+        if isinstance(result, dict):
+            results[file_id].update(result)
 
-            except Exception as e:
-                backoff = min(2 ** (attempt + 1), 30)
-                logger.warning(
-                    "  Batch %d attempt %d/%d: error, "
-                    "retrying in %ds: %s",
-                    batch_idx + 1,
-                    attempt + 1,
-                    max_retries,
-                    backoff,
-                    e,
-                )
-                if attempt < max_retries - 1:
-                    time.sleep(backoff)
-            except json.JSONDecodeError as e:
-                backoff = min(2 ** attempt, 10)
-                logger.warning(
-                    "  Batch %d attempt %d/%d: JSON parse error: %s",
-                    batch_idx + 1,
-                    attempt + 1,
-                    max_retries,
-                    e,
-                )
-                if attempt < max_retries - 1:
-                    time.sleep(backoff)
-            except Exception as e:
-                backoff = min(2 ** (attempt + 1), 30)
-                logger.warning(
-                    "  Batch %d attempt %d/%d: API error: %s",
-                    batch_idx + 1,
-                    attempt + 1,
-                    max_retries,
-                    backoff,
-                    e,
-                )
-                if attempt < max_retries - 1:
-                    time.sleep(backoff)
-        else:
-            logger.error(
-                "  Batch %d: all %d retries exhausted, skipping",
-                batch_idx + 1,
-                max_retries,
-            )
+    translated = sum(len(r) for r in results)
+    total = sum(len(j) for j in jobs)
+    logger.info("Batch API translation complete: %d/%d entries translated", translated, total)
+    return results
 
-        # Rate limiting: small delay between batches
-        if batch_idx < total_batches - 1:
-            time.sleep(1.0)
 
-    logger.info("LLM translation complete: %d/%d entries translated", len(translated), len(entries))
-    return translated
+# ── Pipeline ───────────────────────────────────────────────────────
 
 
-# ── Pipeline ───────────────────────────────────────────────────────
+@dataclass(slots=True)
+class _FileJob:
+    """One extracted lang file after dictionary matching, awaiting the LLM."""
+
+    subdir_name: str
+    rel_path: str
+    stem: str
+    output_file: Path
+    data: dict
+    entries: dict[str, str]
+    dict_translated: dict[str, str]
+    already_done: dict[str, str]
+    still_remaining: dict[str, str]
 
 
 def _is_fully_translated(output_file: Path, entries: dict[str, str]) -> bool:
@@ -399,7 +773,7 @@ def _is_fully_translated(output_file: Path, entries: dict[str, str]) -> bool:
     if not output_file.exists():
         return False
     try:
-        existing = json.loads(output_file.read_text(encoding="utf-8"))
+        existing = read_json(output_file)
         if not isinstance(existing, dict):
             return False
         # Check that all keys exist and values differ from English originals
@@ -420,7 +794,7 @@ def _load_partial_translations(output_file: Path) -> dict[str, str]:
     if not output_file.exists():
         return {}
     try:
-        data = json.loads(output_file.read_text(encoding="utf-8"))
+        data = read_json(output_file)
         if isinstance(data, dict):
             return data
         return {}
@@ -428,6 +802,200 @@ def _load_partial_translations(output_file: Path) -> dict[str, str]:
         return {}
 
 
+def translation_settings_digest(config: AppConfig) -> str:
+    """Digest of the settings LLM translations depend on.
+
+    Covers the model ID, the target language and the terminology table.
+    """
+    terminology = json.dumps(config.custom_terminology, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(
+        f"{config.openai_model_id}\0{config.target_lang}\0{terminology}".encode("utf-8")
+    ).hexdigest()
+
+
+def _value_cache_path(config: AppConfig) -> Path:
+    """Location of the value cache for the current translation settings.
+
+    A cached translation is only reused under the settings that produced it.
+    """
+    return config.work_dir / ".llm_cache" / f"values-{translation_settings_digest(config)}.json"
+
+
+# Minimum seconds between value cache rewrites while files are translating;
+# translated files themselves are still saved after every batch
+_VALUE_CACHE_SAVE_INTERVAL = 30.0
+
+
+def _load_value_cache(cache_path: Path) -> dict[str, str]:
+    """Load the English value -> LLM translation cache from earlier runs."""
+    try:
+        data = read_json(cache_path)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_value_cache(cache_path: Path, value_cache: dict[str, str]) -> None:
+    """Write the value cache atomically so an interrupted run never truncates it."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        data = orjson.dumps(value_cache)
+    else:
+        data = json.dumps(value_cache, ensure_ascii=False).encode("utf-8")
+    _atomic_write_bytes(cache_path, data)
+
+
+def _unique_values(jobs: list[_FileJob]) -> dict[str, str]:
+    """Map one representative key to each distinct pending English value.
+
+    The first key seen for a value is kept so the model still gets a real
+    translation key as context; a clashing key gets a ``#n`` suffix.
+    """
+    request: dict[str, str] = {}
+    seen: set[str] = set()
+    for job in jobs:
+        for key, value in job.still_remaining.items():
+            if value in seen:
+                continue
+            seen.add(value)
+            if key in request:
+                key = f"{key}#{len(request)}"
+            request[key] = value
+    return request
+
+
+async def _translate_jobs_async(
+    jobs: list[_FileJob],
+    config: AppConfig,
+    dictionary: dict[str, str],
+    batch_results: list[dict[str, str]] | None,
+    value_cache: dict[str, str],
+    cache_path: Path,
+) -> list[str]:
+    """Run the LLM phase for each file and write it to disk.
+
+    Up to ``config.file_concurrency`` files are processed at once. All files
+    share one client (and so one connection pool) and one in-flight batch
+    limit. Each distinct English value is sent once: the first file that
+    needs it translates it, later files wait for that result, and finished
+    values are recorded in ``value_cache``, which is saved to ``cache_path``
+    at most every _VALUE_CACHE_SAVE_INTERVAL seconds and once more when the
+    run ends or is interrupted. Returns the mod IDs that used LLM translation, for upload
+    filtering, in job order.
+    """
+    # Mod ID per job index, so the result follows job order, not completion order
+    job_mods: list[str | None] = [None] * len(jobs)
+    needs_client = (
+        batch_results is None
+        and bool(config.openai_api_key)
+        and any(job.still_remaining for job in jobs)
+    )
+
+    # One batch limit for the whole run, however many files are in flight
+    batch_semaphore = asyncio.Semaphore(max(1, config.llm_concurrency))
+    file_semaphore = asyncio.Semaphore(max(1, config.file_concurrency))
+    # English value -> result of the file currently translating it
+    in_flight: dict[str, asyncio.Future[str | None]] = {}
+    # Whether value_cache has entries not yet on disk, and when it was last saved
+    cache_dirty = False
+    cache_saved_at = time.monotonic()
+
+    async def _process_one_file(job_idx: int, job: _FileJob) -> None:
+        nonlocal cache_dirty, cache_saved_at
+        async with file_semaphore:
+            # Build a helper to merge & save current state to disk
+            def _save_progress(llm_so_far: dict[str, str]) -> None:
+                """Flush current translation state to disk (called after each LLM batch)."""
+                # Layered updates, last wins: dictionary > resumed > LLM > original.
+                # Updating existing keys keeps the original key order; keys the
+                # LLM invented are dropped.
+                merged = dict(job.data)
+                merged.update({k: llm_so_far[k] for k in llm_so_far.keys() & merged.keys()})
+                merged.update(job.already_done)
+                merged.update(job.dict_translated)
+                job.output_file.parent.mkdir(parents=True, exist_ok=True)
+                _atomic_write_bytes(job.output_file, _dumps(merged))
+
+            # Phase 2: LLM translation for remaining
+            # on_batch_done saves to disk after every batch — crash-safe
+            llm_translated: dict[str, str] = {}
+            if batch_results is not None:
+                llm_translated = batch_results[job_idx]
+            elif job.still_remaining:
+                own: dict[str, str] = {}
+                waiting: dict[str, asyncio.Future[str | None]] = {}
+                for key, value in job.still_remaining.items():
+                    zh = value_cache.get(value)
+                    if zh is not None:
+                        llm_translated[key] = zh
+                    elif value in in_flight:
+                        waiting[key] = in_flight[value]
+                    else:
+                        in_flight[value] = asyncio.get_running_loop().create_future()
+                        own[key] = value
+
+                def _on_batch_done(llm_so_far: dict[str, str]) -> None:
+                    for key, zh in llm_so_far.items():
+                        value = own.get(key)
+                        if value is not None and not in_flight[value].done():
+                            value_cache[value] = zh
+                            in_flight[value].set_result(zh)
+                    _save_progress({**llm_translated, **llm_so_far})
+
+                if own:
+                    llm_translated.update(await translate_with_llm_async(
+                        own, config, dictionary,
+                        on_batch_done=_on_batch_done, client=client,
+                        semaphore=batch_semaphore, cache=cache,
+                    ))
+                    # Values whose batch failed are released for a later file to retry
+                    for value in own.values():
+                        if not in_flight[value].done():
+                            in_flight.pop(value).set_result(None)
+                    cache_dirty = True
+                    if time.monotonic() - cache_saved_at >= _VALUE_CACHE_SAVE_INTERVAL:
+                        _save_value_cache(cache_path, value_cache)
+                        cache_dirty = False
+                        cache_saved_at = time.monotonic()
+
+                for key, future in waiting.items():
+                    zh = await future
+                    if zh is not None:
+                        llm_translated[key] = zh
+
+            # Final write (ensures dict-only files are also saved)
+            _save_progress(llm_translated)
+
+            translated_count = len(job.dict_translated) + len(job.already_done) + len(llm_translated)
+
+            # Record if this mod used LLM (for upload filtering)
+            if (llm_translated or job.already_done) and job.subdir_name == "mods":
+                # rel_path is like "modid/en_us.json", extract modid
+                modid = job.rel_path.split("/", 1)[0] if "/" in job.rel_path else job.stem
+                job_mods[job_idx] = modid
+
+            logger.info(
+                "  %s: translated %d/%d entries (dict: %d, resumed: %d, llm: %d)",
+                job.rel_path,
+                translated_count,
+                len(job.entries),
+                len(job.dict_translated),
+                len(job.already_done),
+                len(llm_translated),
+            )
+
+    try:
+        async with _create_llm_client(config) if needs_client else contextlib.nullcontext() as client:
+            with _open_response_cache(config) if needs_client else contextlib.nullcontext() as cache:
+                await asyncio.gather(*(_process_one_file(i, job) for i, job in enumerate(jobs)))
+    finally:
+        # Also reached on errors and Ctrl-C, so finished values are kept
+        if cache_dirty:
+            _save_value_cache(cache_path, value_cache)
+
+    return list(dict.fromkeys(modid for modid in job_mods if modid is not None))
+
+
 def translate_all(
     extracted_dir: Path,
     translated_dir: Path,
@@ -450,10 +1018,10 @@ def translate_all(
     # Collect stats
     total_files = 0
     skipped_files = 0
-    translated_files = 0
 
-    # Track which mods used LLM translation (for upload filtering)
-    llm_translated_mods: set[str] = set()
+    # Pass 1: dictionary matching and resume bookkeeping for every file, so
+    # the LLM phase knows the full workload before sending anything
+    jobs: list[_FileJob] = []
 
     # Process each extraction type
     for subdir_name in ("mods", "kubejs", "ftbquests"):
@@ -471,13 +1039,15 @@ def translate_all(
             logger.info("No JSON files found in %s", subdir)
             continue
 
+        # Relative paths by slicing off the root instead of Path.relative_to
+        root_len = len(str(subdir)) + 1
         for file_idx, json_file in enumerate(json_files):
-            rel_path = json_file.relative_to(subdir)
+            rel_path = str(json_file)[root_len:].replace(os.sep, "/")
             output_file = out_subdir / rel_path
             total_files += 1
 
             try:
-                data = json.loads(json_file.read_text(encoding="utf-8"))
+                data = read_json(json_file)
             except Exception as e:
                 logger.warning("Failed to read %s: %s", json_file, e)
                 continue
@@ -544,54 +1114,56 @@ def translate_all(
                     len(still_remaining),
                 )
 
-            # Build a helper to merge & save current state to disk
-            def _save_progress(llm_so_far: dict[str, str]) -> None:
-                """Flush current translation state to disk (called after each LLM batch)."""
-                merged: dict[str, str] = {}
-                for key in data:
-                    if key in dict_translated:
-                        merged[key] = dict_translated[key]
-                    elif key in already_done:
-                        merged[key] = already_done[key]
-                    elif key in llm_so_far:
-                        merged[key] = llm_so_far[key]
-                    else:
-                        merged[key] = data[key]
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-                output_file.write_text(
-                    json.dumps(merged, indent=2, ensure_ascii=False) + "\n",
-                    encoding="utf-8",
-                )
-
-            # Phase 2: LLM translation for remaining
-            # on_batch_done saves to disk after every batch — crash-safe
-            llm_translated = {}
-            if still_remaining:
-                llm_translated = translate_with_llm(
-                    still_remaining, config, dictionary,
-                    on_batch_done=_save_progress,
-                )
-
-            # Final write (ensures dict-only files are also saved)
-            _save_progress(llm_translated)
-
-            translated_count = len(dict_translated) + len(already_done) + len(llm_translated)
-            translated_files += 1
-
-            # Record if this mod used LLM (for upload filtering)
-            if (llm_translated or already_done) and subdir_name == "mods":
-                # rel_path is like "modid/en_us.json", extract modid
-                modid = rel_path.parts[0] if len(rel_path.parts) > 1 else rel_path.stem
-                llm_translated_mods.add(modid)
-
-            logger.info(
-                "  Translated %d/%d entries (dict: %d, resumed: %d, llm: %d)",
-                translated_count,
-                len(entries),
-                len(dict_translated),
-                len(already_done),
-                len(llm_translated),
-            )
+            jobs.append(_FileJob(
+                subdir_name=subdir_name,
+                rel_path=rel_path,
+                stem=json_file.stem,
+                output_file=output_file,
+                data=data,
+                entries=entries,
+                dict_translated=dict_translated,
+                already_done=already_done,
+                still_remaining=still_remaining,
+            ))
+
+    # Reuse LLM translations of identical English values from earlier runs
+    cache_path = _value_cache_path(config)
+    value_cache = _load_value_cache(cache_path)
+    cache_hits = 0
+    for job in jobs:
+        for key, value in list(job.still_remaining.items()):
+            zh = value_cache.get(value)
+            if zh is not None:
+                job.already_done[key] = zh
+                del job.still_remaining[key]
+                cache_hits += 1
+    if cache_hits:
+        logger.info("Reused %d cached LLM translations", cache_hits)
+
+    # Large workloads go through one Batch API job instead of per-file calls
+    batch_results: list[dict[str, str]] | None = None
+    if config.use_batch_api:
+        request = _unique_values(jobs)
+        if len(request) >= config.batch_api_threshold:
+            logger.info("Sending %d unique values through the Batch API...", len(request))
+            results = translate_with_batch_api([request], config, dictionary)
+            if results is None:
+                logger.warning("Batch API unavailable, falling back to per-file LLM calls")
+            else:
+                for key, zh in results[0].items():
+                    if key in request:
+                        value_cache[request[key]] = zh
+                _save_value_cache(cache_path, value_cache)
+                batch_results = [
+                    {k: value_cache[v] for k, v in job.still_remaining.items() if v in value_cache}
+                    for job in jobs
+                ]
+
+    # Pass 2: LLM translation and writing each file, over one shared client
+    llm_translated_mods = asyncio.run(
+        _translate_jobs_async(jobs, config, dictionary, batch_results, value_cache, cache_path)
+    )
+    translated_files = len(jobs)
 
     # Save manifest of LLM-translated mods
     manifest_path = translated_dir / "mods" / "_llm_translated.json"
@@ -601,14 +1173,12 @@ def translate_all(
         existing_mods: list[str] = []
         if manifest_path.exists():
             try:
-                existing_mods = json.loads(manifest_path.read_text(encoding="utf-8"))
+                existing_mods = read_json(manifest_path)
             except Exception:
                 pass
-        all_llm_mods = sorted(set(existing_mods) | llm_translated_mods)
-        manifest_path.write_text(
-            json.dumps(all_llm_mods, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
+        # Earlier entries keep their place; new mods follow in job order
+        all_llm_mods = list(dict.fromkeys([*existing_mods, *llm_translated_mods]))
+        _atomic_write_bytes(manifest_path, _dumps(all_llm_mods))
         logger.info("LLM-translated mods manifest: %d mods", len(all_llm_mods))
 
     logger.info(
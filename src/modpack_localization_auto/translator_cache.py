@@ -0,0 +1,67 @@
+"""Persistent cache of LLM translation responses.
+
+Responses are stored in a small SQLite database keyed by a hash of the
+model and the exact (system, user) messages, so re-running a batch with an
+identical prompt never reaches the API again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """SQLite-backed ``prompt hash -> response`` store."""
+
+    def __init__(self, db_path: Path) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL lets several runs read while one writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "hash TEXT PRIMARY KEY, response TEXT NOT NULL, ts INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(model: str, system_prompt: str, user_content: str) -> str:
+        """Hash identifying one request."""
+        h = hashlib.blake2b(digest_size=20)
+        for part in (model, system_prompt, user_content):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT response FROM responses WHERE hash = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, response: str) -> None:
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (hash, response, ts) VALUES (?, ?, ?)",
+                (key, response, int(time.time())),
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            # A cache write failure must never fail the translation itself
+            logger.warning("Failed to cache LLM response: %s", e)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> LLMResponseCache:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -3,24 +3,57 @@
 Uses the GitHub Git Data API to batch all file changes into a single
 commit and push, avoiding multiple Action triggers.
 
-Flow: create blobs → create tree → create commit → update ref
+Flow: look up HEAD and its file SHAs → commit the changed files with one
+GraphQL createCommitOnBranch mutation, or via REST: create tree (text inline,
+other files as blobs) → create commit → update ref
 """
 
 from __future__ import annotations
 
 import base64
+import functools
+import hashlib
 import json
 import logging
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import httpx
 
+from ._json_io import loads, read_json
 from .config import AppConfig
+from .http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
 GITHUB_API = "https://api.github.com"
 
+# Concurrent blob uploads; kept modest to stay clear of GitHub's secondary rate limits
+_BLOB_WORKERS = 10
+# Concurrent mod file reads while collecting the upload
+_READ_WORKERS = 8
+# Attempts per REST call when GitHub answers 429/5xx or the connection drops
+_MAX_ATTEMPTS = 5
+# Files up to this size are sent inline in the tree request instead of as blobs
+_INLINE_MAX_BYTES = 512 * 1024
+
+
+# Branch head commit and its tree in a single request
+_HEAD_QUERY = (
+    "query ($o: String!, $n: String!, $b: String!) {"
+    " repository(owner: $o, name: $n) {"
+    " ref(qualifiedName: $b) { target { oid ... on Commit { tree { oid } } } } } }"
+)
+
+
+# Atomic commit of file additions, guarded by expectedHeadOid
+_COMMIT_MUTATION = (
+    "mutation ($i: CreateCommitOnBranchInput!) {"
+    " createCommitOnBranch(input: $i) { commit { oid } } }"
+)
+
 
 def _headers(token: str) -> dict[str, str]:
     return {
@@ -35,100 +68,146 @@ def upload_to_dict_repo(
     translated_dir: Path,
     mc_version: str,
     config: AppConfig,
-) -> None:
+    translated_lang: dict[str, dict[str, str]] | None = None,
+    client: httpx.Client | None = None,
+) -> bool:
     """Upload translated mod files to i18n-Dict-Merged in a single commit.
 
     Only uploads mods listed in _llm_translated.json (LLM-translated mods).
     Each mod produces two files: en_us.json (originals) + zh_cn.json (translations).
     All files are committed in one batch push via the Git Data API.
+
+    ``translated_lang`` may carry the already-parsed translated lang files
+    (see packager.load_translated_lang) to avoid parsing them a second time.
+    ``client`` defaults to the process-wide pooled client, so repeated calls
+    (e.g. one per mc_version) reuse its connections.
+
+    Returns False if the upload was skipped (no token, unreadable manifest)
+    or failed,
+    True once there is nothing left to upload.
     """
     if not config.github_token:
         logger.warning("No GITHUB_TOKEN configured, skipping dict upload")
-        return
+        return False
 
     mods_extracted = extracted_dir / "mods"
     mods_translated = translated_dir / "mods"
 
     if not mods_translated.is_dir():
         logger.info("No translated mods found, skipping upload")
-        return
+        return True
 
     # Only upload mods that used LLM translation
     manifest_path = mods_translated / "_llm_translated.json"
     if not manifest_path.exists():
         logger.info("No LLM translation manifest found, skipping upload")
-        return
+        return True
 
     try:
-        llm_modids: list[str] = json.loads(manifest_path.read_text(encoding="utf-8"))
+        llm_modids: list[str] = read_json(manifest_path)
     except Exception as e:
         logger.warning("Failed to read LLM manifest: %s", e)
-        return
-
-    llm_modid_set = set(llm_modids)
-
-    # Collect files to upload
-    file_entries: list[tuple[str, bytes]] = []  # (repo_path, content)
+        return False
 
-    for modid in sorted(llm_modid_set):
+    headers = _headers(config.github_token)
+    repo = config.dict_repo
+    branch = "main"
+    if client is None:
+        client = get_http_client()
+
+    # Look up the branch head and its file list on a worker thread while the
+    # mod files are read from disk below, hiding the round-trips behind local I/O
+    lookup = ThreadPoolExecutor(max_workers=1)
+    base_future = lookup.submit(_get_base, client, repo, branch, headers)
+    lookup.shutdown(wait=False)
+
+    # Collect files to upload. Mods whose files are unchanged since the last
+    # successful upload to the same target (same size and mtime) reuse the
+    # recorded decision and blob SHAs without reading anything.
+    cache_path = config.work_dir / ".upload-cache.json"
+    target = f"{repo}@{branch}/{mc_version}"
+    try:
+        upload_cache = read_json(cache_path)
+    except (OSError, ValueError):
+        upload_cache = {}
+    if not isinstance(upload_cache, dict) or upload_cache.get("target") != target:
+        upload_cache = {}
+    cached_mods = upload_cache.get("mods")
+    if not isinstance(cached_mods, dict):
+        cached_mods = {}
+    new_cache: dict[str, dict] = {}
+    reused: list[str] = []
+
+    sigs: dict[str, list[list[int] | None]] = {}
+    to_read: list[str] = []
+    # Manifest order (as translate_all wrote it); dict.fromkeys drops any duplicates
+    for modid in dict.fromkeys(llm_modids):
         mod_translated = mods_translated / modid
-        zh_cn_file = mod_translated / "en_us.json"  # Contains Chinese translations
-        en_us_file = mods_extracted / modid / "en_us.json"
-
-        if not zh_cn_file.exists() or not en_us_file.exists():
-            logger.debug("  %s: missing files, skipping", modid)
-            continue
-
-        try:
-            en_content = en_us_file.read_bytes()
-            zh_content = zh_cn_file.read_bytes()
-        except Exception as e:
-            logger.warning("  %s: failed to read files: %s", modid, e)
-            continue
-
-        # Validate JSON
-        try:
-            en_data = json.loads(en_content)
-            zh_data = json.loads(zh_content)
-        except json.JSONDecodeError as e:
-            logger.warning("  %s: invalid JSON: %s", modid, e)
-            continue
-
-        # Skip if no actual translations (all values same as English)
-        has_translation = any(
-            zh_data.get(k) != v for k, v in en_data.items() if k in zh_data
-        )
-        if not has_translation:
-            logger.debug("  %s: no actual translations, skipping", modid)
-            continue
-
-        base_path = f"assets/{mc_version}/{modid}"
-        file_entries.append((f"{base_path}/en_us.json", en_content))
-        file_entries.append((f"{base_path}/zh_cn.json", zh_content))
-        
-        # --- Handle Patchouli Dictionaries ---
-        zh_patchouli_file = mod_translated / "patchouli.json"
-        en_patchouli_file = mods_extracted / modid / "patchouli.json"
-        if zh_patchouli_file.exists() and en_patchouli_file.exists():
-            try:
-                en_patchouli_content = en_patchouli_file.read_bytes()
-                zh_patchouli_content = zh_patchouli_file.read_bytes()
-                
-                en_patch_data = json.loads(en_patchouli_content)
-                zh_patch_data = json.loads(zh_patchouli_content)
-                
-                patch_has_translation = any(
-                    zh_patch_data.get(k) != v for k, v in en_patch_data.items() if k in zh_patch_data
+        sig = [
+            _stat_sig(path)
+            for path in (
+                mods_extracted / modid / "en_us.json",
+                mod_translated / "en_us.json",
+                mods_extracted / modid / "patchouli.json",
+                mod_translated / "patchouli.json",
+            )
+        ]
+        sigs[modid] = sig
+        cached = cached_mods.get(modid)
+        if isinstance(cached, dict) and cached.get("sig") == sig:
+            new_cache[modid] = cached
+            reused.append(modid)
+        else:
+            to_read.append(modid)
+
+    # Read and validate the changed mods in parallel; small-file reads are
+    # latency-bound, so several in flight keep the disk queue busy
+    collect = functools.partial(
+        _collect_mod_files,
+        mods_extracted=mods_extracted,
+        mods_translated=mods_translated,
+        mc_version=mc_version,
+        translated_lang=translated_lang,
+    )
+    with ThreadPoolExecutor(max_workers=_READ_WORKERS) as pool:
+        collected = dict(zip(to_read, pool.map(collect, to_read)))
+
+    def _file_entries() -> list[tuple[str, bytes | None, str]]:
+        """Return (repo_path, content, blob_sha) entries in manifest order.
+
+        Content is None for entries reused by SHA.
+        """
+        file_entries: list[tuple[str, bytes | None, str]] = []
+        for modid in sigs:
+            if modid not in collected:
+                file_entries.extend(
+                    (path, None, sha) for path, sha in new_cache[modid]["entries"]
                 )
-                
-                if patch_has_translation:
-                    file_entries.append((f"{base_path}/patchouli.json", zh_patchouli_content))
-            except Exception as e:
-                logger.warning("  %s: failed to read/validate patchouli files: %s", modid, e)
+                continue
+            entries = collected[modid]
+            if entries is None:
+                new_cache.pop(modid, None)
+                continue  # unreadable or invalid; try again next run
+            shas = [_git_blob_sha(content) for _, content in entries]
+            new_cache[modid] = {
+                "sig": sigs[modid],
+                "entries": [[path, sha] for (path, _), sha in zip(entries, shas)],
+            }
+            file_entries.extend(
+                (path, content, sha) for (path, content), sha in zip(entries, shas)
+            )
+        return file_entries
+
+    file_entries = _file_entries()
+
+    if reused:
+        logger.info("Reused upload decisions for %d unchanged mods", len(reused))
 
     if not file_entries:
         logger.info("No files to upload after filtering")
-        return
+        _save_upload_cache(cache_path, target, new_cache)
+        base_future.exception()  # don't leave the lookup's error unobserved
+        return True
 
     logger.info(
         "Uploading %d files (%d mods) to %s in a single commit...",
@@ -138,70 +217,422 @@ def upload_to_dict_repo(
     )
 
     # ── Git Data API: single commit, single push ──
-    headers = _headers(config.github_token)
-    repo = config.dict_repo
-    branch = "main"
-
-    with httpx.Client(follow_redirects=True, timeout=60.0) as client:
+    try:
+        _batch_commit(client, repo, branch, file_entries, headers, mc_version, base_future)
+    except Exception as e:
+        if not any(content is None for _, content, _ in file_entries):
+            logger.error("Upload failed: %s", e)
+            return False
+        # A reused SHA may not exist upstream (another dict_repo, a force-push),
+        # which GitHub rejects on every attempt: drop the cache and send content
+        logger.warning("Upload with cached blob SHAs failed (%s), retrying with file contents", e)
+        cache_path.unlink(missing_ok=True)
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as pool:
+            collected.update(zip(reused, pool.map(collect, reused)))
+        file_entries = _file_entries()
         try:
             _batch_commit(client, repo, branch, file_entries, headers, mc_version)
         except Exception as e:
             logger.error("Upload failed: %s", e)
-            return
+            return False
 
+    _save_upload_cache(cache_path, target, new_cache)
     logger.info("Upload complete: %d files in 1 commit", len(file_entries))
+    return True
 
 
-def _batch_commit(
+def _stat_sig(path: Path) -> list[int] | None:
+    """(size, mtime_ns) of a file, or None if it is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _git_blob_sha(content: bytes) -> str:
+    """The SHA git (and GitHub) assigns to a blob with this content."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+def _collect_mod_files(
+    modid: str,
+    mods_extracted: Path,
+    mods_translated: Path,
+    mc_version: str,
+    translated_lang: dict[str, dict[str, str]] | None,
+) -> list[tuple[str, bytes]] | None:
+    """Return the (repo_path, content) files to upload for one mod.
+
+    An empty list means there is nothing to upload for it; None means its
+    files could not be read or parsed.
+    """
+    mod_translated = mods_translated / modid
+    zh_cn_file = mod_translated / "en_us.json"  # Contains Chinese translations
+    en_us_file = mods_extracted / modid / "en_us.json"
+
+    if not zh_cn_file.exists() or not en_us_file.exists():
+        logger.debug("  %s: missing files, skipping", modid)
+        return []
+
+    try:
+        en_content = en_us_file.read_bytes()
+        zh_content = zh_cn_file.read_bytes()
+    except Exception as e:
+        logger.warning("  %s: failed to read files: %s", modid, e)
+        return None
+
+    # Byte-identical files are untranslated; no need to parse them at all
+    if zh_content == en_content:
+        logger.debug("  %s: no actual translations, skipping", modid)
+        return []
+
+    # Validate JSON
+    try:
+        en_data = loads(en_content)
+        if translated_lang is not None and modid in translated_lang:
+            zh_data = translated_lang[modid]
+        else:
+            zh_data = loads(zh_content)
+    except json.JSONDecodeError as e:
+        logger.warning("  %s: invalid JSON: %s", modid, e)
+        return None
+
+    # Skip if no actual translations (identical to the English file)
+    if zh_data == en_data:
+        logger.debug("  %s: no actual translations, skipping", modid)
+        return []
+
+    base_path = f"assets/{mc_version}/{modid}/"
+    entries = [
+        (base_path + "en_us.json", en_content),
+        (base_path + "zh_cn.json", zh_content),
+    ]
+    
+    # --- Handle Patchouli Dictionaries ---
+    zh_patchouli_file = mod_translated / "patchouli.json"
+    en_patchouli_file = mods_extracted / modid / "patchouli.json"
+    if zh_patchouli_file.exists() and en_patchouli_file.exists():
+        try:
+            en_patchouli_content = en_patchouli_file.read_bytes()
+            zh_patchouli_content = zh_patchouli_file.read_bytes()
+            
+            if zh_patchouli_content != en_patchouli_content and (
+                loads(zh_patchouli_content) != loads(en_patchouli_content)
+            ):
+                entries.append((base_path + "patchouli.json", zh_patchouli_content))
+        except Exception as e:
+            logger.warning("  %s: failed to read/validate patchouli files: %s", modid, e)
+
+    return entries
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float | None:
+    """Seconds to wait before retrying ``resp``, or None if it is final.
+
+    Honors Retry-After and the X-RateLimit-Reset of an exhausted quota, and
+    otherwise backs off exponentially with jitter.
+    """
+    status = resp.status_code
+    rate_limited = resp.headers.get("x-ratelimit-remaining") == "0"
+    if not (status == 429 or status >= 500 or (status == 403 and (
+        rate_limited or "retry-after" in resp.headers
+    ))):
+        return None
+    if "retry-after" in resp.headers:
+        try:
+            return float(resp.headers["retry-after"])
+        except ValueError:
+            pass
+    if rate_limited and "x-ratelimit-reset" in resp.headers:
+        try:
+            return max(0.0, float(resp.headers["x-ratelimit-reset"]) - time.time()) + 1
+        except ValueError:
+            pass
+    return min(60, 2 ** attempt) + random.uniform(0, 1)
+
+
+def _request_with_retry(
+    client: httpx.Client,
+    method: str,
+    url: str,
+    **kwargs,
+) -> httpx.Response:
+    """Send a GitHub REST request, retrying rate limits and transient errors.
+
+    Only used for requests that are safe to repeat (blobs and trees are
+    content-addressed; the ref update is idempotent).
+    """
+    for attempt in range(_MAX_ATTEMPTS - 1):
+        try:
+            resp = client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            delay = min(60, 2 ** attempt) + random.uniform(0, 1)
+            logger.warning("  %s %s failed (%s), retrying in %.1fs", method, url, e, delay)
+        else:
+            delay = _retry_delay(resp, attempt)
+            if delay is None:
+                return resp
+            logger.warning(
+                "  %s %s returned %d, retrying in %.1fs", method, url, resp.status_code, delay
+            )
+        time.sleep(delay)
+    return client.request(method, url, **kwargs)
+
+
+def _save_upload_cache(cache_path: Path, target: str, cache: dict[str, dict]) -> None:
+    """Write the upload cache atomically; failures only cost a re-read next run.
+
+    ``target`` (repo@branch/mc_version) is stored so entries are only reused
+    for uploads to the same place.
+    """
+    tmp = cache_path.with_suffix(".tmp")
+    try:
+        tmp.write_text(json.dumps({"target": target, "mods": cache}), encoding="utf-8")
+        tmp.replace(cache_path)
+    except OSError as e:
+        logger.warning("Failed to save upload cache: %s", e)
+
+
+def _create_blob(
+    client: httpx.Client,
+    repo: str,
+    content: bytes,
+    headers: dict[str, str],
+) -> str:
+    """Upload one file's content as a blob and return its SHA.
+
+    Text is posted as UTF-8; base64 (a third larger) only for anything else.
+    """
+    try:
+        body = {"content": content.decode("utf-8"), "encoding": "utf-8"}
+    except UnicodeDecodeError:
+        body = {"content": base64.b64encode(content).decode("ascii"), "encoding": "base64"}
+    blob_resp = _request_with_retry(
+        client,
+        "POST",
+        f"{GITHUB_API}/repos/{repo}/git/blobs",
+        headers=headers,
+        json=body,
+    )
+    blob_resp.raise_for_status()
+    return blob_resp.json()["sha"]
+
+
+def _get_head(
     client: httpx.Client,
     repo: str,
     branch: str,
-    files: list[tuple[str, bytes]],
     headers: dict[str, str],
-    mc_version: str,
-) -> None:
-    """Create a single commit with all files and push it."""
-    # 1. Get current HEAD SHA and tree SHA
+) -> tuple[str, str]:
+    """Return the (commit SHA, tree SHA) at the tip of ``branch``.
+
+    Asks GraphQL for both in one round-trip, falling back to the two REST
+    lookups if that fails.
+    """
+    owner, name = repo.split("/", 1)
+    try:
+        gql_resp = client.post(
+            f"{GITHUB_API}/graphql",
+            headers=headers,
+            json={
+                "query": _HEAD_QUERY,
+                "variables": {"o": owner, "n": name, "b": f"refs/heads/{branch}"},
+            },
+        )
+        gql_resp.raise_for_status()
+        target = gql_resp.json()["data"]["repository"]["ref"]["target"]
+        # Shows whether the shared client negotiated HTTP/2 (needs h2 installed)
+        logger.info("  GitHub API connection: %s", gql_resp.http_version)
+        return target["oid"], target["tree"]["oid"]
+    except (httpx.HTTPError, KeyError, TypeError, ValueError) as e:
+        logger.debug("GraphQL head lookup failed, using REST: %s", e)
+
     ref_resp = client.get(
         f"{GITHUB_API}/repos/{repo}/git/ref/heads/{branch}",
         headers=headers,
     )
     ref_resp.raise_for_status()
     head_sha = ref_resp.json()["object"]["sha"]
+    # Shows whether the shared client negotiated HTTP/2 (needs h2 installed)
+    logger.info("  GitHub API connection: %s", ref_resp.http_version)
 
     commit_resp = client.get(
         f"{GITHUB_API}/repos/{repo}/git/commits/{head_sha}",
         headers=headers,
     )
     commit_resp.raise_for_status()
-    base_tree_sha = commit_resp.json()["tree"]["sha"]
+    return head_sha, commit_resp.json()["tree"]["sha"]
 
-    # 2. Create blobs for all files
-    tree_items = []
-    for i, (path, content) in enumerate(files):
-        blob_resp = client.post(
-            f"{GITHUB_API}/repos/{repo}/git/blobs",
+
+def _get_base(
+    client: httpx.Client,
+    repo: str,
+    branch: str,
+    headers: dict[str, str],
+) -> tuple[str, str, dict[str, str]]:
+    """Return the branch head, its tree SHA and the ``path -> blob SHA`` map
+    of every file in that tree.
+
+    The map is only used to skip unchanged files, so it is left empty if the
+    tree listing fails.
+    """
+    head_sha, base_tree_sha = _get_head(client, repo, branch, headers)
+    try:
+        tree_resp = client.get(
+            f"{GITHUB_API}/repos/{repo}/git/trees/{base_tree_sha}",
             headers=headers,
-            json={
-                "content": base64.b64encode(content).decode("ascii"),
-                "encoding": "base64",
-            },
+            params={"recursive": "1"},
+        )
+        tree_resp.raise_for_status()
+        tree = tree_resp.json()
+    except (httpx.HTTPError, ValueError) as e:
+        logger.warning("  Could not list the upstream tree, uploading all files: %s", e)
+        return head_sha, base_tree_sha, {}
+    if tree.get("truncated"):
+        logger.info("  Upstream tree listing is truncated; unlisted files are uploaded")
+    existing = {
+        entry["path"]: entry["sha"] for entry in tree["tree"] if entry["type"] == "blob"
+    }
+    return head_sha, base_tree_sha, existing
+
+
+def _commit_on_branch(
+    client: httpx.Client,
+    repo: str,
+    branch: str,
+    files: list[tuple[str, bytes | None, str]],
+    headers: dict[str, str],
+    head_sha: str,
+    message: str,
+) -> str | None:
+    """Commit ``files`` on top of ``head_sha`` with ``createCommitOnBranch``.
+
+    Returns the new commit SHA, or None if the mutation was rejected (e.g.
+    the branch moved or the payload is too large) so the caller can fall
+    back to the REST flow.
+    """
+    headline, _, body = message.partition("\n\n")
+    commit_input = {
+        "branch": {"repositoryNameWithOwner": repo, "branchName": branch},
+        "expectedHeadOid": head_sha,
+        "message": {"headline": headline, "body": body},
+        "fileChanges": {
+            "additions": [
+                {"path": path, "contents": base64.b64encode(content).decode("ascii")}
+                for path, content, _ in files
+            ]
+        },
+    }
+    try:
+        resp = client.post(
+            f"{GITHUB_API}/graphql",
+            headers=headers,
+            json={"query": _COMMIT_MUTATION, "variables": {"i": commit_input}},
         )
-        blob_resp.raise_for_status()
-        blob_sha = blob_resp.json()["sha"]
+        resp.raise_for_status()
+        result = resp.json()
+        if result.get("errors"):
+            raise ValueError(result["errors"][0].get("message", result["errors"]))
+        return result["data"]["createCommitOnBranch"]["commit"]["oid"]
+    except (httpx.HTTPError, KeyError, TypeError, ValueError) as e:
+        logger.info("  GraphQL commit failed, falling back to the REST API: %s", e)
+        return None
+
 
-        tree_items.append({
-            "path": path,
-            "mode": "100644",
-            "type": "blob",
-            "sha": blob_sha,
-        })
+def _batch_commit(
+    client: httpx.Client,
+    repo: str,
+    branch: str,
+    files: list[tuple[str, bytes | None, str]],
+    headers: dict[str, str],
+    mc_version: str,
+    base: Future[tuple[str, str, dict[str, str]]] | None = None,
+) -> None:
+    """Create a single commit with all changed files and push it.
 
-        if (i + 1) % 20 == 0:
-            logger.info("  Created %d/%d blobs...", i + 1, len(files))
+    ``files`` holds (repo_path, content, blob_sha) entries; entries without
+    content refer to a blob that was uploaded by an earlier run. ``base`` may
+    be an already started :func:`_get_base` lookup.
+    """
+    # 1. Get current HEAD SHA, tree SHA and the blob SHAs already upstream
+    if base is not None:
+        head_sha, base_tree_sha, existing = base.result()
+    else:
+        head_sha, base_tree_sha, existing = _get_base(client, repo, branch, headers)
+
+    # 2. Blob SHAs are content hashes, so a matching SHA means the file is
+    # already up to date and can be left to base_tree
+    changed = [entry for entry in files if existing.get(entry[0]) != entry[2]]
+    if len(changed) < len(files):
+        logger.info("  %d/%d files unchanged upstream", len(files) - len(changed), len(files))
+    if not changed:
+        logger.info("  No changes detected compared to upstream. Skipping commit.")
+        return
 
-    # 3. Create tree
-    tree_resp = client.post(
+    mod_count = len({path.rsplit("/", 1)[0] for path, _, _ in changed})
+    commit_message = (
+        f"feat: add translations for {mod_count} mods ({mc_version})\n\n"
+        f"Auto-generated by modpack-localization-auto"
+    )
+
+    # One atomic GraphQL mutation replaces the tree/commit/ref steps below.
+    # It needs every file's content, so entries reused by SHA take REST.
+    if all(content is not None for _, content, _ in changed):
+        new_commit_sha = _commit_on_branch(
+            client, repo, branch, changed, headers, head_sha, commit_message
+        )
+        if new_commit_sha is not None:
+            logger.info(
+                "  Committed %s (%d files, %d mods)",
+                new_commit_sha[:8],
+                len(changed),
+                mod_count,
+            )
+            return
+
+    # Text files go inline in the tree request, which creates their blobs
+    # implicitly; only large or non-UTF-8 files need a separate blob POST
+    inline: dict[int, str] = {}
+    for i, (_, content, _) in enumerate(changed):
+        if content is not None and len(content) <= _INLINE_MAX_BYTES:
+            try:
+                inline[i] = content.decode("utf-8")
+            except UnicodeDecodeError:
+                pass
+
+    tree_items = []
+    with ThreadPoolExecutor(max_workers=_BLOB_WORKERS) as pool:
+        futures = {
+            i: pool.submit(_create_blob, client, repo, content, headers)
+            for i, (_, content, _) in enumerate(changed)
+            if content is not None and i not in inline
+        }
+        try:
+            # 3. Build tree entries in input order
+            created = 0
+            for i, (path, _, sha) in enumerate(changed):
+                item = {"path": path, "mode": "100644", "type": "blob"}
+                if i in inline:
+                    item["content"] = inline[i]
+                elif i not in futures:
+                    item["sha"] = sha
+                else:
+                    item["sha"] = futures[i].result()
+                    created += 1
+                    if created % 20 == 0:
+                        logger.info("  Created %d/%d blobs...", created, len(futures))
+                tree_items.append(item)
+        except BaseException:
+            # Don't start uploads for a commit that is going to fail anyway
+            for future in futures.values():
+                future.cancel()
+            raise
+
+    # 4. Create tree
+    tree_resp = _request_with_retry(
+        client,
+        "POST",
         f"{GITHUB_API}/repos/{repo}/git/trees",
         headers=headers,
         json={
@@ -216,14 +647,10 @@ def _batch_commit(
         logger.info("  No changes detected compared to upstream (tree is identical). Skipping commit.")
         return
 
-    # 4. Create commit
-    mod_count = len(files) // 2
-    commit_message = (
-        f"feat: add translations for {mod_count} mods ({mc_version})\n\n"
-        f"Auto-generated by modpack-localization-auto"
-    )
-
-    new_commit_resp = client.post(
+    # 5. Create commit
+    new_commit_resp = _request_with_retry(
+        client,
+        "POST",
         f"{GITHUB_API}/repos/{repo}/git/commits",
         headers=headers,
         json={
@@ -235,8 +662,10 @@ def _batch_commit(
     new_commit_resp.raise_for_status()
     new_commit_sha = new_commit_resp.json()["sha"]
 
-    # 5. Update ref (this is the single push)
-    update_resp = client.patch(
+    # 6. Update ref (this is the single push)
+    update_resp = _request_with_retry(
+        client,
+        "PATCH",
         f"{GITHUB_API}/repos/{repo}/git/refs/heads/{branch}",
         headers=headers,
         json={"sha": new_commit_sha},
@@ -246,6 +675,6 @@ def _batch_commit(
     logger.info(
         "  Committed %s (%d files, %d mods)",
         new_commit_sha[:8],
-        len(files),
+        len(changed),
         mod_count,
     )
@@ -1,18 +1,31 @@
+import mmap
+import os
 import re
-from pathlib import Path
 
+# Group 2 is the created id, group 4 the display name; \1 and \3 match the
+# quote that opened each literal. Bytes pattern: files are scanned undecoded
 _CREATE_DISPLAY_NAME_RE = re.compile(
-    r"""create\(\s*(?:'([^']*)'|"([^"]*)"|`([^`]*)`)\s*\).*?\.displayName\(\s*(?:'([^']*)'|"([^"]*)"|`([^`]*)`)\s*\)"""
+    rb"""create\(\s*(["'`])(.*?)\1\s*\).*?\.displayName\(\s*(["'`])(.*?)\3\s*\)"""
 )
 
-for js_file in Path('work/create-stellar/instance/kubejs').rglob('*.js'):
-    content = js_file.read_text('utf-8', errors='replace')
-    for line in content.splitlines():
-        for m in _CREATE_DISPLAY_NAME_RE.finditer(line):
-            # find group 1, 2, 3
-            item_id = None
-            for i in range(1, 4):
-                if m.group(i): item_id = m.group(i)
+
+def _walk_js(root):
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_js(entry.path)
+            elif entry.name.endswith('.js') and entry.stat().st_size:
+                yield entry.path
+
+
+for js_file in _walk_js('work/create-stellar/instance/kubejs'):
+    with open(js_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # '.' doesn't match newlines, so every match stays within one line
+        for m in _CREATE_DISPLAY_NAME_RE.finditer(mm):
+            item_id = m.group(2).decode('utf-8', 'replace')
             if item_id and item_id.upper() in ['ABA', 'ABC', 'ACA']:
+                 line_start = mm.rfind(b'\n', 0, m.start()) + 1
+                 line_end = mm.find(b'\n', m.end())
+                 line = mm[line_start:line_end if line_end != -1 else len(mm)]
                  print(f"Found {item_id} natively inside: {js_file}")
-                 print("Line:", line)
+                 print("Line:", line.decode('utf-8', 'replace'))
@@ -1,11 +1,21 @@
-import re
+import os
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path('libs/kubejs-string-extractor/src').resolve()))
 from kubejs_string_extractor.extractor import extract_from_file
 
-for js_file in Path('work/create-stellar/instance/kubejs').rglob('*.js'):
+
+def _walk_js(root):
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_js(entry.path)
+            elif entry.name.endswith('.js'):
+                yield Path(entry.path)
+
+
+for js_file in _walk_js('work/create-stellar/instance/kubejs'):
     try:
         res = extract_from_file(js_file)
         for s in res.strings:
@@ -1,19 +1,20 @@
 import re
 
-pattern1 = re.compile(r"""\.displayName\(\s*(?:'([^']*)'|"([^"]*)"|`([^`]*)`)\s*\)""")
+pattern1 = re.compile(r"""\.displayName\(\s*(["'`])(.*?)\1\s*\)""", re.ASCII)
 line = 'event.create(`${id}_mechanism`).texture(`stellar:item/incomplete_${id}_mechanism`).displayName(`Incomplete ${name} Mechanism`);'
 
 m1 = pattern1.search(line)
 if m1:
-    print("DISPLAY MATCHED:", m1.groups())
+    print("DISPLAY MATCHED:", m1.group(2))
 else:
     print("DISPLAY NO MATCH")
 
 pattern2 = re.compile(
-    r"""create\(\s*(?:'([^']*)'|"([^"]*)"|`([^`]*)`)\s*\).*?\.displayName\(\s*(?:'([^']*)'|"([^"]*)"|`([^`]*)`)\s*\)"""
+    r"""create\(\s*(["'`])(.*?)\1\s*\).*?\.displayName\(\s*(["'`])(.*?)\3\s*\)""",
+    re.ASCII,
 )
 m2 = pattern2.search(line)
 if m2:
-    print("CREATE MATCHED:", m2.groups())
+    print("CREATE MATCHED:", m2.group(2), m2.group(4))
 else:
     print("CREATE NO MATCH")